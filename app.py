@@ -8,7 +8,7 @@ import logging
 import chainlit as cl
 import os
 from dotenv import load_dotenv
-from ui.chainlit_orchestrator import ChainlitOrchestrator
+from ui.chainlit_orchestrator import get_orchestrator
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,40 +21,34 @@ logger = logging.getLogger(__name__)
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"), override=True)
 
 # Initialize the Chainlit orchestrator
-print("[DEBUG] Initializing ChainlitOrchestrator...")
+logger.debug("Initializing ChainlitOrchestrator...")
 try:
-    orchestrator = ChainlitOrchestrator()
-    print("[DEBUG] ChainlitOrchestrator initialized successfully")
-except Exception as e:
-    print(f"[ERROR] Failed to initialize ChainlitOrchestrator: {e}")
-    import traceback
-    traceback.print_exc()
+    orchestrator = get_orchestrator()
+    logger.debug("ChainlitOrchestrator initialized successfully")
+except Exception:
+    logger.exception("Failed to initialize ChainlitOrchestrator")
     raise
 
 @cl.on_chat_start
 async def start():
     """Handle chat start event by delegating to orchestrator."""
-    print("[DEBUG] on_chat_start triggered!")
+    logger.debug("on_chat_start triggered!")
     try:
         await orchestrator.on_chat_start()
-        print("[DEBUG] orchestrator.on_chat_start() completed successfully")
-    except Exception as e:
-        print(f"[ERROR] Error in orchestrator.on_chat_start(): {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("orchestrator.on_chat_start() completed successfully")
+    except Exception:
+        logger.exception("Error in orchestrator.on_chat_start()")
         raise
 
 @cl.on_message
 async def main(message: cl.Message):
     """Handle incoming user messages by delegating to orchestrator."""
-    print(f"[DEBUG] on_message triggered with: {message.content if message else 'None'}")
+    logger.debug("on_message triggered with: %s", message.content if message else None)
     try:
         await orchestrator.on_message(message)
-        print("[DEBUG] orchestrator.on_message() completed successfully")
-    except Exception as e:
-        print(f"[ERROR] Error in orchestrator.on_message(): {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("orchestrator.on_message() completed successfully")
+    except Exception:
+        logger.exception("Error in orchestrator.on_message()")
         raise
 
 # All functionality has been moved to specialized modules following SOLID principles:
@@ -5,7 +5,7 @@ This layer implements business logic specific to the BA Assistant project.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, AsyncIterator, Tuple
 
 
 class BAKnowledgeInterface(ABC):
@@ -27,6 +27,39 @@ class BAKnowledgeInterface(ABC):
         """
         pass
     
+    @abstractmethod
+    def astream_business_knowledge(self, query: str) -> AsyncIterator[str]:
+        """
+        Search business knowledge and yield formatted result fragments.
+        
+        Streaming counterpart of search_business_knowledge - lets the UI
+        render each result as soon as it is available.
+        
+        Args:
+            query: Business-related search query
+            
+        Yields:
+            Formatted result fragments for display
+        """
+        pass
+    
+    @abstractmethod
+    async def search_business_knowledge_batch(self, queries: List[str]) -> List[str]:
+        """
+        Search business knowledge for several queries at once.
+
+        Batched counterpart of search_business_knowledge - concurrent
+        callers share one retrieval round instead of paying the full
+        per-call overhead each.
+
+        Args:
+            queries: Business-related search queries
+
+        Returns:
+            Formatted search result strings, positionally matching queries
+        """
+        pass
+
     @abstractmethod
     async def add_business_documents(
         self, 
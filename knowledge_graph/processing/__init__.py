@@ -4,13 +4,14 @@ Layer 2 - Content processing and transformation services.
 """
 
 # Import from organized sub-modules
-from .interfaces import ContentProcessorInterface
+from .interfaces import ContentProcessorInterface, IngestResult
 from .services import ContentProcessorService
 from .converters import DocumentConverter
 from .parsers import MarkdownSectionParser
 
 __all__ = [
     'ContentProcessorInterface',
+    'IngestResult',
     'ContentProcessorService', 
     'DocumentConverter',
     'MarkdownSectionParser'
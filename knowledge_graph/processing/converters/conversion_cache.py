@@ -0,0 +1,102 @@
+"""
+Conversion Cache
+Layer 2 - Content-addressed on-disk cache for document conversions.
+"""
+
+import hashlib
+import os
+import tempfile
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Cache directory for converted markdown, keyed by content hash - repeat
+# uploads of the same document skip the MarkItDown parse entirely
+_CACHE_DIR = os.path.join(".ba_assistant", "conversion_cache")
+
+# Read size for the pre-3.11 hashing fallback
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def _content_digest(file_path: str) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Uses hashlib.file_digest where available (Python 3.11+), which hashes
+    through OpenSSL on a kernel-sized buffer instead of loading the whole
+    file into Python memory; older interpreters fall back to chunked reads.
+
+    Args:
+        file_path (str): Path to the file to hash
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while True:
+            chunk = f.read(_HASH_CHUNK_BYTES)
+            if not chunk:
+                break
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _cache_path(digest: str) -> str:
+    """Return the cache file path for a content digest."""
+    return os.path.join(_CACHE_DIR, f"{digest}.md")
+
+
+def get_or_convert(file_path: str, convert) -> str:
+    """
+    Return the cached conversion for a file, converting on a miss.
+
+    The cache key is the file's content hash, so renamed or re-uploaded
+    copies of the same document hit the cache. Entries are written
+    atomically via os.replace so concurrent converters never observe a
+    partial file. Cache failures fall back to a plain conversion - the
+    cache is an optimization, never a correctness dependency.
+
+    Args:
+        file_path (str): Path to the file to convert
+        convert: Callable taking the file path and returning markdown text
+
+    Returns:
+        str: Markdown content of the file
+    """
+    try:
+        digest = _content_digest(file_path)
+    except OSError as e:
+        logger.warning(f"Could not hash {file_path} for conversion cache: {e}")
+        return convert(file_path)
+
+    cache_path = _cache_path(digest)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        pass
+
+    markdown_content = convert(file_path)
+
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(markdown_content)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache conversion for {file_path}: {e}")
+
+    return markdown_content
+
+
+def clear_cache() -> None:
+    """Remove all cached conversions."""
+    try:
+        for name in os.listdir(_CACHE_DIR):
+            os.unlink(os.path.join(_CACHE_DIR, name))
+    except OSError:
+        pass
@@ -3,11 +3,60 @@ Document Converter
 Layer 2 - Convert various file formats to markdown content.
 """
 
-from typing import List, Tuple, Any
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Any, Iterator, Optional
 import logging
 
+from .conversion_cache import get_or_convert
+
 logger = logging.getLogger(__name__)
 
+# Upper bound for concurrent conversions - MarkItDown releases the GIL
+# during file I/O and native parsing, so threads give near-linear speedup
+_MAX_CONVERT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Shared MarkItDown instance - constructing one scans plugin entry points,
+# which dominates setup time when converters are created per request
+_MD_SINGLETON: Optional[Any] = None
+_MD_LOCK = threading.Lock()
+
+# MIME types MarkItDown can convert - frozenset for O(1) membership checks
+# on the upload classification path
+_SUPPORTED_FORMATS = frozenset({
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",  # .pptx
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
+    "text/markdown",             # .md
+    "text/html",                 # .html
+    "application/pdf",           # .pdf
+    "text/plain"                 # .txt
+})
+
+
+def get_markitdown():
+    """
+    Return the shared MarkItDown instance, creating it on first use.
+
+    Returns:
+        MarkItDown: Shared converter instance
+
+    Raises:
+        ImportError: If MarkItDown is not installed
+    """
+    global _MD_SINGLETON
+    if _MD_SINGLETON is None:
+        with _MD_LOCK:
+            if _MD_SINGLETON is None:
+                try:
+                    from markitdown import MarkItDown
+                except ImportError as e:
+                    logger.error(f"Failed to import MarkItDown: {e}")
+                    raise ImportError("MarkItDown is required for document conversion. Please install it.")
+                _MD_SINGLETON = MarkItDown(enable_plugins=True)
+    return _MD_SINGLETON
+
 
 class DocumentConverter:
     """
@@ -16,13 +65,8 @@ class DocumentConverter:
     """
     
     def __init__(self):
-        """Initialize the document converter with MarkItDown."""
-        try:
-            from markitdown import MarkItDown
-            self._markitdown = MarkItDown(enable_plugins=True)
-        except ImportError as e:
-            logger.error(f"Failed to import MarkItDown: {e}")
-            raise ImportError("MarkItDown is required for document conversion. Please install it.")
+        """Initialize the document converter with the shared MarkItDown instance."""
+        self._markitdown = get_markitdown()
     
     def convert_file_to_markdown(self, file_path: str) -> str:
         """
@@ -38,11 +82,17 @@ class DocumentConverter:
             Exception: If file conversion fails
         """
         try:
-            result = self._markitdown.convert(file_path)
-            return result.text_content if result else ""
+            # Content-hash cache - re-uploads of the same document skip
+            # the MarkItDown parse entirely
+            return get_or_convert(file_path, self._convert_uncached)
         except Exception as e:
             logger.error(f"Failed to convert file {file_path}: {e}")
             raise Exception(f"Document conversion failed for {file_path}: {str(e)}")
+
+    def _convert_uncached(self, file_path: str) -> str:
+        """Run the MarkItDown conversion without consulting the cache."""
+        result = self._markitdown.convert(file_path)
+        return result.text_content if result else ""
     
     def convert_files_to_markdown(self, files: List[Any]) -> List[Tuple[str, str]]:
         """
@@ -59,16 +109,27 @@ class DocumentConverter:
         """
         converted_files = []
         failed_files = []
-        
-        for file in files:
-            try:
-                file_path = file.path
-                markdown_content = self.convert_file_to_markdown(file_path)
-                converted_files.append((file_path, markdown_content))
-                logger.info(f"Successfully converted file: {file_path}")
-            except Exception as e:
-                failed_files.append((file.path if hasattr(file, 'path') else str(file), str(e)))
-                logger.error(f"Failed to convert file: {e}")
+
+        # Conversions are independent, so run them concurrently and collect
+        # results in submission order to keep the output deterministic
+        with ThreadPoolExecutor(max_workers=_MAX_CONVERT_WORKERS) as executor:
+            futures = []
+            for file in files:
+                try:
+                    futures.append((file, executor.submit(self.convert_file_to_markdown, file.path)))
+                except Exception as e:
+                    failed_files.append((str(file), str(e)))
+                    logger.error(f"Failed to convert file: {e}")
+
+            for file, future in futures:
+                try:
+                    file_path = file.path
+                    markdown_content = future.result()
+                    converted_files.append((file_path, markdown_content))
+                    logger.info(f"Successfully converted file: {file_path}")
+                except Exception as e:
+                    failed_files.append((file.path if hasattr(file, 'path') else str(file), str(e)))
+                    logger.error(f"Failed to convert file: {e}")
         
         if failed_files:
             failed_list = [f"- {path}: {error}" for path, error in failed_files]
@@ -83,6 +144,32 @@ class DocumentConverter:
         
         return converted_files
     
+    def iter_convert_files_to_markdown(self, files: List[Any]) -> Iterator[Tuple[str, str]]:
+        """
+        Convert multiple files to markdown content, yielding results lazily.
+
+        Generator counterpart of convert_files_to_markdown - holds one
+        converted document at a time instead of the whole corpus, so peak
+        memory stays proportional to a single file. Conversions still run
+        concurrently; results are yielded in submission order.
+
+        Args:
+            files (List[Any]): List of file objects with .path attribute
+
+        Yields:
+            Tuple[str, str]: (file_path, markdown_content) tuples
+
+        Raises:
+            Exception: If a file conversion fails
+        """
+        with ThreadPoolExecutor(max_workers=_MAX_CONVERT_WORKERS) as executor:
+            futures = [
+                (file.path, executor.submit(self.convert_file_to_markdown, file.path))
+                for file in files
+            ]
+            for file_path, future in futures:
+                yield file_path, future.result()
+
     def get_supported_formats(self) -> List[str]:
         """
         Get list of supported file formats.
@@ -90,15 +177,7 @@ class DocumentConverter:
         Returns:
             List[str]: List of supported MIME types
         """
-        return [
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
-            "application/vnd.openxmlformats-officedocument.presentationml.presentation",  # .pptx
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
-            "text/markdown",             # .md
-            "text/html",                 # .html
-            "application/pdf",           # .pdf
-            "text/plain"                 # .txt
-        ]
+        return list(_SUPPORTED_FORMATS)
     
     def is_supported_format(self, mime_type: str) -> bool:
         """
@@ -110,4 +189,4 @@ class DocumentConverter:
         Returns:
             bool: True if format is supported
         """
-        return mime_type in self.get_supported_formats()
+        return mime_type in _SUPPORTED_FORMATS
@@ -3,6 +3,6 @@ Processing Interfaces
 Layer 2 - Abstract interfaces for content processing operations.
 """
 
-from .content_processor_interface import ContentProcessorInterface
+from .content_processor_interface import ContentProcessorInterface, IngestResult
 
-__all__ = ['ContentProcessorInterface']
+__all__ = ['ContentProcessorInterface', 'IngestResult']
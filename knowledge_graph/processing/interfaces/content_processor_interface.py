@@ -5,10 +5,49 @@ This layer abstracts content processing and uses Layer 1 for actual Graphiti ope
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple, Union
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 
 
+@dataclass(slots=True)
+class IngestResult:
+    """
+    Result of a content ingest operation.
+
+    Slots-based dataclass - cheaper to allocate than the per-call response
+    dicts it replaces, and gives callers attribute access instead of key
+    lookups. Use asdict() at boundaries that still need plain dicts.
+    """
+
+    success: bool
+    message: str
+    episodes_added: int
+    details: List[Dict[str, Any]]
+    content_processed: Optional[str] = None
+    files_processed: Optional[int] = None
+    file_processed: Optional[str] = None
+    error: Optional[str] = None
+
+    def asdict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON-style boundaries."""
+        result = {
+            "success": self.success,
+            "message": self.message,
+            "episodes_added": self.episodes_added,
+            "details": self.details
+        }
+        if self.content_processed is not None:
+            result["content_processed"] = self.content_processed
+        if self.files_processed is not None:
+            result["files_processed"] = self.files_processed
+        if self.file_processed is not None:
+            result["file_processed"] = self.file_processed
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+
 class ContentProcessorInterface(ABC):
     """
     Abstract interface for content processing operations.
@@ -21,7 +60,7 @@ class ContentProcessorInterface(ABC):
         text: str, 
         title: str, 
         source_description: str = "Text content"
-    ) -> Dict[str, Any]:
+    ) -> "IngestResult":
         """
         Add text content as an episode to the knowledge graph.
         
@@ -35,12 +74,29 @@ class ContentProcessorInterface(ABC):
         """
         pass
     
+    @abstractmethod
+    async def add_bulk_text_contents(
+        self,
+        items: List[Tuple[str, str]]
+    ) -> "IngestResult":
+        """
+        Add pre-chunked text contents as episodes to the knowledge graph.
+        Preferred path when input is already sectioned - skips markdown parsing.
+
+        Args:
+            items: List of tuples containing (title, text)
+
+        Returns:
+            Episode creation result with metadata
+        """
+        pass
+
     @abstractmethod
     async def add_file_content(
         self, 
         file_path: str, 
         file_content: str
-    ) -> List[Dict[str, Any]]:
+    ) -> "IngestResult":
         """
         Add file content as episodes to the knowledge graph.
         Automatically parses the content into sections.
@@ -50,7 +106,7 @@ class ContentProcessorInterface(ABC):
             file_content: Content of the file
             
         Returns:
-            List of episode creation results with metadata
+            Ingest result with per-episode details
         """
         pass
     
@@ -58,7 +114,7 @@ class ContentProcessorInterface(ABC):
     async def add_multiple_files(
         self, 
         files: List[Tuple[str, str]]
-    ) -> List[Dict[str, Any]]:
+    ) -> "IngestResult":
         """
         Add multiple files as episodes to the knowledge graph.
         Uses bulk processing for better performance.
@@ -67,7 +123,7 @@ class ContentProcessorInterface(ABC):
             files: List of tuples containing (file_path, file_content)
             
         Returns:
-            List of episode creation results with metadata
+            Ingest result with per-episode details
         """
         pass
     
@@ -77,7 +133,7 @@ class ContentProcessorInterface(ABC):
         json_data: Dict[str, Any], 
         title: str,
         source_description: str = "JSON data"
-    ) -> Dict[str, Any]:
+    ) -> "IngestResult":
         """
         Add JSON data as an episode to the knowledge graph.
         
@@ -95,7 +151,7 @@ class ContentProcessorInterface(ABC):
     async def add_structured_content(
         self, 
         content_items: List[Dict[str, Union[str, Dict]]]
-    ) -> List[Dict[str, Any]]:
+    ) -> "IngestResult":
         """
         Add structured content items to the knowledge graph.
         Each item should have 'title', 'content', and optional 'metadata'.
@@ -104,7 +160,7 @@ class ContentProcessorInterface(ABC):
             content_items: List of structured content items
             
         Returns:
-            List of episode creation results with metadata
+            Ingest result with per-episode details
         """
         pass
     
@@ -1,110 +1,48 @@
 """
 Markdown Section Parser
-Layer 2 - Parse markdown content into structured sections using mistletoe.
+Layer 2 - Parse markdown content into structured sections.
 """
 
-import mistletoe
-from mistletoe import Document
-from mistletoe.block_token import Heading, Paragraph, CodeFence, Quote, List as MistletoeList
-from mistletoe.base_renderer import BaseRenderer
-from typing import List, Dict, Any
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+from typing import List, Dict, Any, Iterator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of parsed documents kept in the per-parser LRU cache
+_SECTION_CACHE_MAX = 128
 
-class SafeMarkdownRenderer(BaseRenderer):
-    """
-    Safe markdown renderer that avoids mistletoe API compatibility issues.
-    """
-    
-    def render_document(self, token):
-        """Render a document token."""
-        if not hasattr(token, 'children') or token.children is None:
-            return ''
-        return ''.join(self.render(child) for child in token.children)
-    
-    def render_heading(self, token):
-        """Render a heading token."""
-        level = '#' * token.level
-        if not hasattr(token, 'children') or token.children is None:
-            content = ''
-        else:
-            content = ''.join(self.render(child) for child in token.children)
-        return f"{level} {content}\n\n"
-    
-    def render_paragraph(self, token):
-        """Render a paragraph token."""
-        if not hasattr(token, 'children') or token.children is None:
-            content = ''
-        else:
-            content = ''.join(self.render(child) for child in token.children)
-        return f"{content}\n\n"
-    
-    def render_raw_text(self, token):
-        """Render raw text token."""
-        return str(token.content)
-    
-    def render_list(self, token):
-        """Render a list token."""
-        items = []
-        if hasattr(token, 'children') and token.children is not None:
-            for item in token.children:
-                if hasattr(item, 'children') and item.children is not None:
-                    item_content = ''.join(self.render(child) for child in item.children)
-                else:
-                    item_content = str(item)
-                items.append(f"- {item_content}")
-        return '\n'.join(items) + '\n\n'
-    
-    def render_code_fence(self, token):
-        """Render a code fence token."""
-        language = getattr(token, 'language', '') or ''
-        content = str(token.children[0].content) if token.children else ''
-        return f"```{language}\n{content}\n```\n\n"
-    
-    def render_quote(self, token):
-        """Render a quote token."""
-        if not hasattr(token, 'children') or token.children is None:
-            content = ''
-        else:
-            content = ''.join(self.render(child) for child in token.children)
-        lines = content.strip().split('\n')
-        quoted_lines = [f"> {line}" for line in lines]
-        return '\n'.join(quoted_lines) + '\n\n'
-    
-    def render(self, token):
-        """Render any token by dispatching to appropriate method."""
-        method_name = f"render_{token.__class__.__name__.lower()}"
-        if hasattr(self, method_name):
-            return getattr(self, method_name)(token)
-        else:
-            # Fallback for unknown tokens
-            if hasattr(token, 'children') and token.children is not None:
-                return ''.join(self.render(child) for child in token.children)
-            elif hasattr(token, 'content'):
-                return str(token.content)
-            else:
-                return str(token)
+# ATX heading line, compiled once - matched per line in the parsing loops
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
 
 
 class MarkdownSectionParser:
     """
-    Parse markdown content into structured sections using mistletoe.
+    Parse markdown content into structured sections.
     Layer 2 - Handles markdown parsing as part of content processing pipeline.
     """
     
     def __init__(self):
-        """Initialize the markdown parser with safe renderer."""
-        self._renderer = SafeMarkdownRenderer()
-    
+        """Initialize the markdown parser."""
+        self._section_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
+        # The shared parser is hit from worker threads when files parse
+        # concurrently - guard the LRU bookkeeping
+        self._cache_lock = threading.Lock()
+
     def parse_markdown_to_sections(self, markdown_content: str) -> List[Dict[str, Any]]:
         """
         Parse markdown content into structured sections based on headings.
-        
+
+        Results are cached by content hash, so re-ingesting the same file
+        (reindex, re-upload, retries) skips the parse entirely.
+
         Args:
             markdown_content (str): Raw markdown content
-            
+
         Returns:
             List[Dict[str, Any]]: List of sections with structure:
             {
@@ -116,173 +54,116 @@ class MarkdownSectionParser:
         """
         if not markdown_content or not markdown_content.strip():
             return []
-        
-        try:
-            # Parse markdown using mistletoe
-            doc = mistletoe.Document(markdown_content)
-            sections = []
-            
-            # Collect content before first heading as introduction
-            intro_tokens = []
-            first_heading_found = False
-            
-            current_section = None
-            current_tokens = []
-            
-            for token in doc.children:
-                if isinstance(token, Heading):
-                    # Save previous section if exists
-                    if current_section is not None:
-                        current_section['content'] = self._render_tokens_to_markdown(current_tokens)
-                        current_section['raw_content'] = self._render_tokens_to_markdown(current_tokens[1:])  # Skip heading
-                        sections.append(current_section)
-                    
-                    # Start new section
-                    current_section = {
-                        'level': token.level,
-                        'title': self._extract_heading_text(token),
-                        'content': '',
-                        'raw_content': ''
-                    }
-                    current_tokens = [token]
-                    first_heading_found = True
-                    
-                else:
-                    if not first_heading_found:
-                        # Collect intro content
-                        intro_tokens.append(token)
-                    else:
-                        # Add to current section
-                        if current_section is not None:
-                            current_tokens.append(token)
-            
-            # Handle introduction section if exists
-            if intro_tokens:
-                intro_content = self._render_tokens_to_markdown(intro_tokens)
-                if intro_content.strip():
-                    intro_section = {
-                        'level': 0,
-                        'title': 'Introduction',
-                        'content': intro_content,
-                        'raw_content': intro_content
-                    }
-                    sections.insert(0, intro_section)
-            
-            # Add final section if exists
-            if current_section is not None:
-                current_section['content'] = self._render_tokens_to_markdown(current_tokens)
-                current_section['raw_content'] = self._render_tokens_to_markdown(current_tokens[1:])  # Skip heading
-                sections.append(current_section)
-            
-            logger.info(f"Successfully parsed markdown into {len(sections)} sections")
-            return sections
-            
-        except Exception as e:
-            logger.error(f"Failed to parse markdown content: {e}")
-            # Fallback to simple regex-based parsing
-            return self._fallback_regex_parsing(markdown_content)
-    
-    def _extract_heading_text(self, heading_token) -> str:
+
+        cache_key = hashlib.blake2b(
+            markdown_content.encode('utf-8'), digest_size=16
+        ).digest()
+        with self._cache_lock:
+            cached = self._section_cache.get(cache_key)
+            if cached is not None:
+                self._section_cache.move_to_end(cache_key)
+                # Copy the section dicts so callers cannot mutate the cache
+                return [dict(section) for section in cached]
+
+        sections = self._parse_sections_uncached(markdown_content)
+
+        with self._cache_lock:
+            self._section_cache[cache_key] = sections
+            if len(self._section_cache) > _SECTION_CACHE_MAX:
+                self._section_cache.popitem(last=False)
+
+        return [dict(section) for section in sections]
+
+    def iter_sections(self, markdown_content: str) -> Iterator[Dict[str, Any]]:
         """
-        Extract clean text from a heading token.
-        
+        Lazily yield sections from markdown content.
+
+        Single-pass line scan; each section dict is produced on demand, so
+        consumers can stream multi-MB documents without ever materializing
+        the full section list. No caching or fallback is applied here - use
+        parse_markdown_to_sections for the cached list API.
+
         Args:
-            heading_token: Mistletoe heading token
-            
-        Returns:
-            str: Clean heading text
+            markdown_content (str): Raw markdown content
+
+        Yields:
+            Dict[str, Any]: Section dicts in document order
         """
-        try:
-            # Create a temporary document with just the heading content
-            temp_doc = Document('')
-            temp_doc.children = heading_token.children
-            
-            # Render and clean up
-            text = self._renderer.render(temp_doc).strip()
-            return text
-        except Exception as e:
-            logger.warning(f"Failed to extract heading text, using fallback: {e}")
-            # Fallback: try to get raw content from children
-            if hasattr(heading_token, 'children') and heading_token.children:
-                # Extract text content from mistletoe tokens properly
-                text_parts = []
-                for child in heading_token.children:
-                    if hasattr(child, 'content'):
-                        # For RawText tokens, use the content attribute
-                        text_parts.append(str(child.content))
-                    elif hasattr(child, 'children'):
-                        # For nested tokens, recursively extract text
-                        for nested_child in child.children:
-                            if hasattr(nested_child, 'content'):
-                                text_parts.append(str(nested_child.content))
-                            else:
-                                text_parts.append(str(nested_child))
-                    else:
-                        # Last resort: convert to string
-                        text_parts.append(str(child))
-                
-                result = ''.join(text_parts).strip()
-                return result if result else "Untitled"
-            return "Untitled"
-    
-    def _render_tokens_to_markdown(self, tokens: List[Any]) -> str:
+        if not markdown_content or not markdown_content.strip():
+            return
+
+        lines = markdown_content.splitlines(keepends=True)
+
+        # Locate headings in one pass, skipping '#' lines that sit
+        # inside fenced code blocks
+        headings = []  # (line_index, level, title)
+        in_fence = False
+        fence_marker = ''
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if in_fence:
+                if stripped.startswith(fence_marker):
+                    in_fence = False
+                continue
+            if stripped.startswith('```') or stripped.startswith('~~~'):
+                in_fence = True
+                fence_marker = stripped[:3]
+                continue
+            # Cheap first-char gate - prose lines skip the regex machinery
+            # (the fallback parser relies on the same gate)
+            if stripped[:1] != '#':
+                continue
+            heading_match = _HEADING_RE.match(stripped)
+            if heading_match:
+                headings.append((i, len(heading_match.group(1)), heading_match.group(2).strip()))
+
+        # Content before the first heading becomes the introduction
+        first_heading_index = headings[0][0] if headings else len(lines)
+        intro_text = ''.join(lines[:first_heading_index]).strip()
+        if intro_text:
+            yield {
+                'level': 0,
+                'title': 'Introduction',
+                'content': intro_text,
+                'raw_content': intro_text
+            }
+
+        # Slice each heading section out of the original lines
+        for pos, (start, level, title) in enumerate(headings):
+            end = headings[pos + 1][0] if pos + 1 < len(headings) else len(lines)
+            yield {
+                'level': level,
+                'title': title,
+                'content': ''.join(lines[start:end]).strip(),
+                'raw_content': ''.join(lines[start + 1:end]).strip()
+            }
+
+    def _parse_sections_uncached(self, markdown_content: str) -> List[Dict[str, Any]]:
         """
-        Render a list of mistletoe tokens back to markdown.
-        
+        Parse markdown content into sections without consulting the cache.
+
+        Sections are assembled by slicing the original lines between heading
+        positions, so per-section cost is an index lookup rather than a
+        render pass. The offset-based regex parser is kept as a fallback.
+
         Args:
-            tokens (List[Any]): List of mistletoe tokens
-            
+            markdown_content (str): Raw markdown content
+
         Returns:
-            str: Rendered markdown content
+            List[Dict[str, Any]]: Parsed sections
         """
-        if not tokens:
-            return ""
-        
         try:
-            # Create temporary document with these tokens
-            temp_doc = Document('')
-            temp_doc.children = tokens
-            
-            # Render to markdown
-            return self._renderer.render(temp_doc)
+            sections = list(self.iter_sections(markdown_content))
+            logger.info(f"Successfully parsed markdown into {len(sections)} sections")
+            return sections
+
         except Exception as e:
-            logger.warning(f"Failed to render tokens to markdown: {e}")
-            # Fallback: extract actual content from tokens
-            content_parts = []
-            for token in tokens:
-                try:
-                    if hasattr(token, 'content'):
-                        # For tokens with direct content (like RawText)
-                        content_parts.append(str(token.content))
-                    elif hasattr(token, 'children') and token.children:
-                        # For tokens with children, recursively extract content
-                        for child in token.children:
-                            if hasattr(child, 'content'):
-                                content_parts.append(str(child.content))
-                            else:
-                                content_parts.append(str(child))
-                    else:
-                        # Last resort: convert to string but try to extract meaningful content
-                        token_str = str(token)
-                        if 'content=' in token_str:
-                            # Try to extract content from object representation
-                            import re
-                            match = re.search(r"content='([^']*)", token_str)
-                            if match:
-                                content_parts.append(match.group(1))
-                            else:
-                                content_parts.append(token_str)
-                        else:
-                            content_parts.append(token_str)
-                except Exception as token_error:
-                    logger.warning(f"Failed to extract content from token {type(token)}: {token_error}")
-                    content_parts.append(str(token))
-            
-            return '\n'.join(content_parts)
-    
+            logger.error(f"Failed to slice markdown content into sections: {e}")
+            return self._fallback_regex_parsing(markdown_content)
+
     def _fallback_regex_parsing(self, markdown_content: str) -> List[Dict[str, Any]]:
         """
-        Fallback regex-based parsing when mistletoe fails.
+        Fallback regex-based parsing when the line-slicing parser fails.
         
         Args:
             markdown_content (str): Raw markdown content
@@ -290,26 +171,35 @@ class MarkdownSectionParser:
         Returns:
             List[Dict[str, Any]]: Parsed sections
         """
-        import re
-        
         logger.info("Using fallback regex parsing for markdown")
         sections = []
-        lines = markdown_content.split('\n')
-        
-        # Collect intro content
-        intro_content = []
-        first_heading_index = -1
-        
-        for i, line in enumerate(lines):
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
+
+        # Single scan: record each line's start offset into the source string
+        # and each heading's position. Section bodies are then produced with
+        # one substring slice apiece instead of the per-section list-copy and
+        # '\n'.join() passes, which are quadratic in aggregate across N
+        # sections of one document.
+        line_starts = [0]
+        line_starts.extend(
+            i + 1 for i, c in enumerate(markdown_content) if c == '\n'
+        )
+        line_starts.append(len(markdown_content) + 1)
+
+        headings = []  # (line_index, level, title)
+        for i in range(len(line_starts) - 1):
+            line = markdown_content[line_starts[i]:line_starts[i + 1] - 1]
+            stripped = line.strip()
+            if stripped[:1] != '#':
+                continue
+            heading_match = _HEADING_RE.match(stripped)
             if heading_match:
-                first_heading_index = i
-                break
-            else:
-                intro_content.append(line)
-        
+                headings.append(
+                    (i, len(heading_match.group(1)), heading_match.group(2).strip())
+                )
+
         # Add introduction section if exists
-        intro_text = '\n'.join(intro_content).strip()
+        intro_end = line_starts[headings[0][0]] if headings else len(markdown_content)
+        intro_text = markdown_content[:intro_end].strip()
         if intro_text:
             sections.append({
                 'level': 0,
@@ -317,45 +207,20 @@ class MarkdownSectionParser:
                 'content': intro_text,
                 'raw_content': intro_text
             })
-        
-        # Parse heading sections
-        current_section = None
-        current_content = []
-        
-        start_index = first_heading_index if first_heading_index >= 0 else 0
-        
-        for i in range(start_index, len(lines)):
-            line = lines[i]
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
-            
-            if heading_match:
-                # Save previous section
-                if current_section is not None:
-                    current_section['content'] = '\n'.join(current_content).strip()
-                    current_section['raw_content'] = '\n'.join(current_content[1:]).strip()  # Skip heading
-                    sections.append(current_section)
-                
-                # Start new section
-                level = len(heading_match.group(1))
-                title = heading_match.group(2).strip()
-                
-                current_section = {
-                    'level': level,
-                    'title': title,
-                    'content': '',
-                    'raw_content': ''
-                }
-                current_content = [line]
+
+        # Each section spans from its heading line to the next heading line
+        for pos, (line_index, level, title) in enumerate(headings):
+            if pos + 1 < len(headings):
+                end = line_starts[headings[pos + 1][0]]
             else:
-                if current_section is not None:
-                    current_content.append(line)
-        
-        # Add final section
-        if current_section is not None:
-            current_section['content'] = '\n'.join(current_content).strip()
-            current_section['raw_content'] = '\n'.join(current_content[1:]).strip()  # Skip heading
-            sections.append(current_section)
-        
+                end = len(markdown_content)
+            sections.append({
+                'level': level,
+                'title': title,
+                'content': markdown_content[line_starts[line_index]:end].strip(),
+                'raw_content': markdown_content[line_starts[line_index + 1]:end].strip()
+            })
+
         return sections
     
     def get_section_summary(self, sections: List[Dict[str, Any]]) -> Dict[str, Any]:
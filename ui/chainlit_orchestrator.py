@@ -11,10 +11,28 @@ from .handlers import (
     CommandHandler,
     MessageHandler,
     FileHandler,
-    ResponseFormatter
+    response_formatter
 )
 
 
+# Shared orchestrator instance - handler wiring only needs to happen once
+# per process, not per importer
+_ORCHESTRATOR = None
+
+
+def get_orchestrator() -> "ChainlitOrchestrator":
+    """
+    Return the shared ChainlitOrchestrator, creating it on first use.
+
+    Returns:
+        ChainlitOrchestrator: Shared orchestrator instance
+    """
+    global _ORCHESTRATOR
+    if _ORCHESTRATOR is None:
+        _ORCHESTRATOR = ChainlitOrchestrator()
+    return _ORCHESTRATOR
+
+
 class ChainlitOrchestrator:
     """
     Main orchestrator that coordinates all Chainlit handlers.
@@ -44,7 +62,7 @@ class ChainlitOrchestrator:
         self.command_handler = CommandHandler(self.factory)
         self.message_handler = MessageHandler(self.factory)
         self.file_handler = FileHandler(self.factory)
-        self.formatter = ResponseFormatter()
+        self.formatter = response_formatter
         
         # Future: LangGraph agent integration placeholder
         self.agent = None
@@ -64,6 +82,10 @@ class ChainlitOrchestrator:
         Args:
             message: Chainlit message object containing user input
         """
+        # Lazy initialization - the knowledge system is set up on the
+        # first interaction instead of during chat start
+        await self.chat_handler.ensure_initialized()
+
         if message.command:
             # Route command messages to command handler
             await self.command_handler.handle_command(message.command)
@@ -82,6 +104,7 @@ class ChainlitOrchestrator:
         Args:
             files: List of uploaded files
         """
+        await self.chat_handler.ensure_initialized()
         await self.file_handler.process_uploaded_files(files)
     
     async def _handle_with_agent(self, message_content: str) -> None:
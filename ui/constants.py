@@ -4,7 +4,7 @@ Centralizes all string literals used across the Chainlit UI handlers.
 Improves maintainability and prepares for future i18n support.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 
 class UIMessages:
@@ -20,15 +20,17 @@ class UIMessages:
 - **Trò chuyện thông minh**: Tương tác trực tiếp qua giao diện, nhận câu trả lời chính xác từ tri thức dự án.  
 - **Tăng hiệu quả**: Cung cấp truy cập thông tin tức thì, giảm thời gian tìm kiếm, hỗ trợ ra quyết định."""
     
+    # Assembled once at import - every chat start reuses the same string
+    WELCOME_MESSAGE = f"{WELCOME_TITLE}\n{WELCOME_DESCRIPTION}\n\n{WELCOME_FEATURES}"
+    
     @classmethod
     def get_welcome_message(cls) -> str:
         """Get complete welcome message."""
-        return f"{cls.WELCOME_TITLE}\n{cls.WELCOME_DESCRIPTION}\n\n{cls.WELCOME_FEATURES}"
+        return cls.WELCOME_MESSAGE
     
     # File Processing Messages
     FILE_UPLOAD_REQUEST = "Please upload files to begin build knowledge graph!"
-    FILE_PROCESSING_START = "I received the following files:\n{file_list}\n\nPlease wait for the system to build knowledge graph..."
-    
+
     # Success Messages
     DOCUMENTS_PROCESSED_SUCCESS = "✅ **Documents processed successfully!**"
     KNOWLEDGE_GRAPH_CLEARED = "✅ Knowledge graph has been cleared successfully!"
@@ -36,23 +38,45 @@ class UIMessages:
     
     # Error Messages
     DOCUMENTS_PROCESSING_ERROR = "❌ **Error processing documents:**"
-    INITIALIZATION_FAILED = "Failed to initialize: {message}"
-    UNKNOWN_COMMAND_ERROR = "Unknown command: {command}"
-    CLEAR_KNOWLEDGE_GRAPH_ERROR = "Failed to clear knowledge graph: {message}"
-    
+
     # Search Messages
     SEARCH_RESULT_PREFIX = "Here is the search result:\n"
+    EMPTY_QUERY_PROMPT = "Please enter a question."
     
     # Agent Messages
     AGENT_NOT_IMPLEMENTED = "🤖 **Agent Processing**\n\nLangGraph agent integration is not yet implemented.\n\nThis handler is prepared for future agent-based workflows including:\n- Multi-step reasoning\n- Tool usage coordination\n- Knowledge graph integration\n- Contextual conversation handling"
     
-    # Feature Coming Soon
-    FEATURE_COMING_SOON = "{feature_name} feature coming soon!"
-    
     # Summary Formatting
     SUMMARY_HEADER = "📊 **Summary:**"
     CATEGORY_HEADER = "📂 **By Category:**"
 
+    # Template helpers - f-strings skip the format-spec parse and kwarg
+    # dict that str.format pays on every call
+    @staticmethod
+    def file_processing_start(file_list: str) -> str:
+        """Render the file-processing start notification."""
+        return f"I received the following files:\n{file_list}\n\nPlease wait for the system to build knowledge graph..."
+
+    @staticmethod
+    def initialization_failed(message: str) -> str:
+        """Render the initialization failure message."""
+        return f"Failed to initialize: {message}"
+
+    @staticmethod
+    def unknown_command(command: str) -> str:
+        """Render the unknown-command error message."""
+        return f"Unknown command: {command}"
+
+    @staticmethod
+    def clear_knowledge_graph_error(message: str) -> str:
+        """Render the clear-knowledge-graph failure message."""
+        return f"Failed to clear knowledge graph: {message}"
+
+    @staticmethod
+    def feature_coming_soon(feature_name: str) -> str:
+        """Render the coming-soon message for a feature."""
+        return f"{feature_name} feature coming soon!"
+
 
 class Commands:
     """Command definitions for Chainlit UI."""
@@ -78,14 +102,18 @@ class Commands:
         "button": True
     }
     
+    # Frozen at import time - one shared tuple instead of a fresh list of
+    # command dicts per handler instance
+    ALL_COMMANDS: Tuple[Dict[str, Any], ...] = (
+        ADD_FILE_SOURCE,
+        MANAGER_FILE_SOURCE,
+        CLEAR_KNOWLEDGE_GRAPH
+    )
+
     @classmethod
     def get_all_commands(cls) -> List[Dict[str, Any]]:
         """Get all available commands."""
-        return [
-            cls.ADD_FILE_SOURCE,
-            cls.MANAGER_FILE_SOURCE,
-            cls.CLEAR_KNOWLEDGE_GRAPH
-        ]
+        return list(cls.ALL_COMMANDS)
 
 
 class FileTypes:
@@ -105,19 +133,23 @@ class FileTypes:
     PDF = "application/pdf"
     PLAIN_TEXT = "text/plain"
     
+    # Frozen at import time - callers get the same tuple back instead of
+    # a freshly built list on every lookup
+    SUPPORTED_MIME_TYPES: Tuple[str, ...] = (
+        DOC,
+        DOCX,
+        XLS,
+        XLSX,
+        MARKDOWN,
+        HTML,
+        PDF,
+        PLAIN_TEXT
+    )
+
     @classmethod
     def get_supported_types(cls) -> List[str]:
         """Get list of all supported MIME types."""
-        return [
-            cls.DOC,
-            cls.DOCX,
-            cls.XLS,
-            cls.XLSX,
-            cls.MARKDOWN,
-            cls.HTML,
-            cls.PDF,
-            cls.PLAIN_TEXT
-        ]
+        return list(cls.SUPPORTED_MIME_TYPES)
 
 
 class FileSettings:
@@ -143,15 +175,6 @@ class DebugMessages:
     MESSAGE_TRIGGERED = "[DEBUG] on_message triggered with: {content}"
     MESSAGE_SUCCESS = "[DEBUG] orchestrator.on_message() completed successfully"
     MESSAGE_ERROR = "[ERROR] Error in orchestrator.on_message(): {error}"
-    
-    # Handler messages
-    HANDLERS_REFACTORED_INFO = "[INFO] ChainlitHandlers is using the new refactored architecture."
-    HANDLERS_DELEGATING_INFO = "[INFO] Delegating to ChainlitOrchestrator and specialized handlers."
-    
-    # Deprecation messages
-    DEPRECATED_HANDLERS = "[DEPRECATED] ChainlitHandlers is deprecated. Use ChainlitOrchestrator instead."
-    DEPRECATED_CHAT_START = "[DEPRECATED] ChainlitHandlers.on_chat_start() is deprecated. Use ChainlitOrchestrator instead."
-    DEPRECATED_MESSAGE = "[DEPRECATED] ChainlitHandlers.on_message() is deprecated. Use ChainlitOrchestrator instead."
 
 
 class AgentWorkflows:
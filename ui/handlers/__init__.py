@@ -9,7 +9,7 @@ from .chat_lifecycle_handler import ChatLifecycleHandler
 from .command_handler import CommandHandler
 from .message_handler import MessageHandler
 from .file_handler import FileHandler
-from .response_formatter import ResponseFormatter
+from . import response_formatter
 
 __all__ = [
     'BaseChainlitHandler',
@@ -17,5 +17,5 @@ __all__ = [
     'CommandHandler',
     'MessageHandler',
     'FileHandler',
-    'ResponseFormatter'
+    'response_formatter'
 ]
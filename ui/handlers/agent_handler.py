@@ -4,10 +4,9 @@ Handles LangGraph agent interactions and workflow orchestration.
 Prepared for future integration with LangGraph agents.
 """
 
-import chainlit as cl
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Sequence
 from .base_handler import BaseChainlitHandler
-from .response_formatter import ResponseFormatter
 from ..constants import UIMessages, AgentWorkflows, StatusMessages
 
 
@@ -33,20 +32,27 @@ class LangGraphAgentHandler(BaseChainlitHandler):
     - Will be implemented when LangGraph integration is required
     """
     
+    # Class-level defaults - the stub does no real work yet, so instances
+    # allocate nothing until a method assigns state. Read-only containers
+    # make the reassign-don't-mutate contract enforceable: mutating a
+    # default in place raises instead of corrupting every instance.
+    agent = None
+    agent_config: Mapping[str, Any] = MappingProxyType({})
+    agent_state: Mapping[str, Any] = MappingProxyType({})
+    workflow_history: Sequence[Any] = ()
+
     def __init__(self, factory, agent_config: Optional[Dict[str, Any]] = None):
         """
         Initialize agent handler with configuration.
-        
+
         Args:
             factory: KnowledgeGraphFactory for dependency injection
             agent_config: Optional agent configuration dictionary
         """
         super().__init__(factory)
-        self.agent_config = agent_config or {}
-        self.agent = None
-        self.agent_state = {}
-        self.workflow_history = []
-        
+        if agent_config:
+            self.agent_config = agent_config
+
         # Future: Agent initialization will happen here
         # self.agent = self._initialize_agent(agent_config)
     
@@ -146,10 +152,12 @@ class LangGraphAgentHandler(BaseChainlitHandler):
         Returns:
             Agent status dictionary
         """
+        # Copies, not references - callers mutating the snapshot must not
+        # reach back into shared handler (or class-default) state
         return {
             "initialized": self.agent is not None,
-            "config": self.agent_config,
-            "state": self.agent_state,
+            "config": dict(self.agent_config),
+            "state": dict(self.agent_state),
             "workflow_count": len(self.workflow_history)
         }
     
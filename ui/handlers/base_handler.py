@@ -5,9 +5,15 @@ Follows Single Responsibility Principle and Dependency Inversion Principle.
 """
 
 from abc import ABC, abstractmethod
-import chainlit as cl
+from functools import cached_property
+from chainlit import Message as _CLMessage
 from knowledge_graph import KnowledgeGraphFactory
 
+# Prefix constants - these helpers end nearly every user-visible action,
+# so the per-send f-string work is hoisted out
+_ERR_PREFIX = "❌ **Error:** "
+_OK_PREFIX = "✅ **Success:** "
+
 
 class BaseChainlitHandler(ABC):
     """
@@ -27,8 +33,18 @@ class BaseChainlitHandler(ABC):
             factory: KnowledgeGraphFactory instance for dependency injection
         """
         self.factory = factory
-        self.ba_knowledge = factory.get_ba_knowledge_service()
-    
+
+    @cached_property
+    def ba_knowledge(self):
+        """
+        BA knowledge service, resolved lazily on first access.
+
+        Handlers are constructed per message in several paths; deferring
+        the factory lookup keeps construction allocation-only. The factory
+        memoizes the service, so every handler shares one instance.
+        """
+        return self.factory.get_ba_knowledge_service()
+
     @abstractmethod
     async def handle(self, *args, **kwargs):
         """
@@ -44,7 +60,7 @@ class BaseChainlitHandler(ABC):
         Args:
             content: Message content to send
         """
-        await cl.Message(content=content).send()
+        await _CLMessage(content=content).send()
     
     async def send_error_message(self, error: str) -> None:
         """
@@ -53,7 +69,7 @@ class BaseChainlitHandler(ABC):
         Args:
             error: Error message to send
         """
-        await cl.Message(content=f"❌ **Error:** {error}").send()
+        await _CLMessage(content=_ERR_PREFIX + error).send()
     
     async def send_success_message(self, message: str) -> None:
         """
@@ -62,4 +78,4 @@ class BaseChainlitHandler(ABC):
         Args:
             message: Success message to send
         """
-        await cl.Message(content=f"✅ **Success:** {message}").send()
+        await _CLMessage(content=_OK_PREFIX + message).send()
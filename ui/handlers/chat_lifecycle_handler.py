@@ -4,16 +4,134 @@ Handles chat initialization, welcome messages, and system setup.
 Follows Single Responsibility Principle - only manages chat lifecycle.
 """
 
+import asyncio
+import json
 import os
+import time
 import logging
 import chainlit as cl
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from .base_handler import BaseChainlitHandler
-from .response_formatter import ResponseFormatter
+from . import response_formatter
 from ..constants import Commands
 
 logger = logging.getLogger(__name__)
 
+# Graph setup checkpoint - bump SCHEMA_VERSION whenever the index or
+# constraint definitions change so stale checkpoints are ignored
+_SCHEMA_VERSION = 1
+_SETUP_CHECKPOINT_PATH = os.path.join(".ba_assistant", "graph_setup.json")
+
+
+def _load_setup_checkpoint() -> bool:
+    """
+    Check whether a valid graph setup checkpoint exists.
+
+    Returns:
+        True if the checkpoint matches the current schema version and
+        Neo4j target, meaning the schema DDL can be skipped entirely.
+    """
+    try:
+        with open(_SETUP_CHECKPOINT_PATH, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return (
+        checkpoint.get("schema_version") == _SCHEMA_VERSION
+        and checkpoint.get("neo4j_uri") == os.getenv("NEO4J_URI")
+    )
+
+
+def _write_setup_checkpoint() -> None:
+    """Record a successful graph setup so restarts can skip the DDL."""
+    try:
+        os.makedirs(os.path.dirname(_SETUP_CHECKPOINT_PATH), exist_ok=True)
+        with open(_SETUP_CHECKPOINT_PATH, "w", encoding="utf-8") as f:
+            json.dump({
+                "schema_version": _SCHEMA_VERSION,
+                "neo4j_uri": os.getenv("NEO4J_URI"),
+                "ts": time.time()
+            }, f)
+    except OSError as e:
+        logger.warning("Could not persist graph setup checkpoint: %s", e)
+
+
+# Environment variables are immutable for the process lifetime, so the
+# configuration scan result is computed once and reused on every chat
+# start. Built lazily rather than at import because the entry point loads
+# .env after this module is imported.
+_CONFIG_SNAPSHOT = None
+
+
+def _build_config_snapshot():
+    """
+    Scan the environment once and build the configuration report.
+
+    Returns:
+        Tuple of (missing_vars, log_lines, report_msg)
+    """
+    env_vars_to_check = [
+        "NEO4J_URI",
+        "NEO4J_USER",
+        "NEO4J_PASSWORD",
+        "OPENAI_API_KEY",
+        "DEFAULT_DATABASE"
+    ]
+
+    log_lines = []
+    missing_vars = []
+    for var in env_vars_to_check:
+        value = os.getenv(var)
+        if not value:
+            missing_vars.append(var)
+            log_lines.append(f"Missing environment variable: {var}")
+        else:
+            # Log partial value for security (don't log full API keys)
+            if "KEY" in var or "PASSWORD" in var:
+                masked_value = value[:8] + "..." + value[-4:] if len(value) > 12 else "***"
+                log_lines.append(f"✅ {var}: {masked_value}")
+            else:
+                log_lines.append(f"✅ {var}: {value}")
+
+    # Check optional environment variables
+    optional_vars = ["SEMAPHORE_LIMIT", "LLM_MODEL"]
+    for var in optional_vars:
+        value = os.getenv(var)
+        if value:
+            log_lines.append(f"✅ {var}: {value}")
+        else:
+            log_lines.append(f"⚠️ Optional {var}: not set (using defaults)")
+
+    # Verify logging configuration
+    root_logger = logging.getLogger()
+    log_lines.append(f"✅ Logging level: {logging.getLevelName(root_logger.level)}")
+    log_lines.append(f"✅ Logging handlers: {len(root_logger.handlers)}")
+
+    if missing_vars:
+        report_msg = (
+            "⚠️ Configuration Error: ❌ Missing critical environment variables: "
+            + ", ".join(missing_vars)
+        )
+    else:
+        report_msg = "✅ System configuration verified successfully"
+
+    return missing_vars, log_lines, report_msg
+
+
+def _get_config_snapshot():
+    """Return the cached configuration snapshot, building it on first use."""
+    global _CONFIG_SNAPSHOT
+    if _CONFIG_SNAPSHOT is None:
+        _CONFIG_SNAPSHOT = _build_config_snapshot()
+    return _CONFIG_SNAPSHOT
+
+
+def reload_config_snapshot():
+    """Rebuild the snapshot after the process environment changes."""
+    global _CONFIG_SNAPSHOT
+    _CONFIG_SNAPSHOT = _build_config_snapshot()
+    return _CONFIG_SNAPSHOT
+
 
 class ChatLifecycleHandler(BaseChainlitHandler):
     """
@@ -30,18 +148,29 @@ class ChatLifecycleHandler(BaseChainlitHandler):
     - Dependency Inversion: Uses BA Knowledge Service abstraction
     """
     
-    # Class-level flag to track if graph setup has been completed
-    _graph_setup_completed = False
-    
+    # Graph setup coordination - the first chat start performs the setup
+    # while concurrent ones wait on the event instead of racing into
+    # duplicate schema builds
+    _graph_setup_done = asyncio.Event()
+    _graph_setup_started = False
+    # Memoized result of initialize_knowledge_system - index/constraint
+    # setup is idempotent and costs a Neo4j round trip, so the process
+    # only pays for it once
+    _init_result = None
+
     def __init__(self, factory):
         """
         Initialize chat lifecycle handler.
-        
+
         Args:
             factory: KnowledgeGraphFactory for dependency injection
         """
         super().__init__(factory)
-        self.commands = Commands.get_all_commands()
+        # Shared immutable tuple - no per-instance list allocation
+        self.commands = Commands.ALL_COMMANDS
+        # Deferred-initialization guard - the expensive knowledge system
+        # setup runs on first real use, not on every chat start
+        self._init_done = False
     
     async def handle(self, *args, **kwargs) -> None:
         """
@@ -56,152 +185,164 @@ class ChatLifecycleHandler(BaseChainlitHandler):
         
         - Sets up commands
         - Displays welcome message
+
+        The expensive knowledge system setup (status check, configuration
+        verification, graph indices) is deferred to ensure_initialized so
+        the welcome screen is not blocked on backend round trips.
+        """
+        # Command registration and the welcome message are independent
+        # round trips to the client - overlap them instead of serializing
+        welcome_content = response_formatter.format_welcome_message()
+        await asyncio.gather(
+            cl.context.emitter.set_commands(self.commands),
+            self.send_message(welcome_content)
+        )
+
+    async def ensure_initialized(self) -> None:
+        """
+        Initialize the knowledge system on first use.
+
         - Checks knowledge system status
-        - Initializes system if needed
+        - Verifies system configuration
+        - Ensures graph indices and constraints are built
+        - Initializes system if no data exists
+
+        Runs the full sequence once per handler; subsequent calls return
+        immediately.
         """
-        # Set up Chainlit commands
-        await cl.context.emitter.set_commands(self.commands)
-        
-        # Display welcome message
-        welcome_content = ResponseFormatter.format_welcome_message()
-        await self.send_message(welcome_content)
-        
-        # Check knowledge system status
-        status = await self.ba_knowledge.get_knowledge_status()
-        print(f"Status: {status} and has data: {status.get('has_data', False)}")
-        
-        # Verify system configuration
-        await self._verify_system_configuration()
-        
-        # Always ensure indices and constraints are built for proper entity extraction
-        await self._ensure_graph_setup()
-        
+        if self._init_done:
+            return
+        self._init_done = True
+
+        # Startup narration is collected here and sent as one message at
+        # the end - each send is a websocket round trip
+        startup_lines: List[str] = []
+
+        # The status query and configuration verification are independent
+        # I/O - overlap them so this path costs the max, not the sum
+        status, _ = await asyncio.gather(
+            self.ba_knowledge.get_knowledge_status(),
+            self._verify_system_configuration(startup_lines)
+        )
+        logger.debug("Status: %s and has data: %s", status, status.get("has_data", False))
+
+        # Graph setup depends on a valid configuration, so it stays sequential
+        await self._ensure_graph_setup(startup_lines)
+
         # Initialize system if no data exists
         if not status.get("has_data", False):
-            await self._initialize_knowledge_system()
+            await self._initialize_knowledge_system(startup_lines)
+
+        if startup_lines:
+            await self.send_message("\n\n---\n\n".join(startup_lines))
     
-    async def _initialize_knowledge_system(self) -> None:
+    async def _initialize_knowledge_system(self, startup_lines: List[str]) -> None:
         """
         Initialize the knowledge system if it's empty.
-        
-        - Calls BA knowledge service to initialize
-        - Handles success/error responses
-        - Triggers file upload request on success
+
+        - Reuses the memoized init result from graph setup when available
+        - Appends success/error narration to startup_lines
+        - Triggers the (interactive) file upload request on success
         """
-        init_result = await self.ba_knowledge.initialize_knowledge_system()
-        
+        init_result = ChatLifecycleHandler._init_result
+        if init_result is None:
+            init_result = await self.ba_knowledge.initialize_knowledge_system()
+            ChatLifecycleHandler._init_result = init_result
+
         if init_result.get("status") == "success":
-            # Import FileHandler here to avoid circular imports
-            from .file_handler import FileHandler
-            file_handler = FileHandler(self.factory)
+            from .command_handler import _get_file_handler_cls
+            file_handler = _get_file_handler_cls()(self.factory)
             await file_handler.ask_file_source()
-            
-            success_message = ResponseFormatter.format_initialization_success()
-            await self.send_message(success_message)
+
+            startup_lines.append(response_formatter.format_initialization_success())
         else:
-            error_message = ResponseFormatter.format_initialization_error(init_result)
-            await self.send_message(error_message)
+            startup_lines.append(response_formatter.format_initialization_error(init_result))
     
-    async def _ensure_graph_setup(self) -> None:
+    async def _ensure_graph_setup(self, startup_lines: List[str]) -> None:
         """
         Ensure graph indices and constraints are properly set up.
         This is critical for entity extraction and relationship creation.
-        Only runs once per application lifecycle.
+        Only runs once per application lifecycle; concurrent chat starts
+        wait for the in-flight setup instead of duplicating it.
         """
-        # Check if setup has already been completed
-        if ChatLifecycleHandler._graph_setup_completed:
-            print("[DEBUG] Graph setup already completed, skipping...")
+        cls = ChatLifecycleHandler
+        if cls._graph_setup_done.is_set():
+            return
+        if cls._graph_setup_started:
+            # Another chat start is mid-setup - wait for its result
+            await cls._graph_setup_done.wait()
             return
-            
+        cls._graph_setup_started = True
+
+        # A matching checkpoint from a previous run means the Neo4j schema
+        # is already in place - skip the DDL round trip entirely
+        if _load_setup_checkpoint():
+            logger.debug("Graph setup checkpoint found, skipping schema build")
+            cls._graph_setup_done.set()
+            return
+
         try:
-            print("[DEBUG] Ensuring graph indices and constraints are built...")
-            
+            logger.debug("Ensuring graph indices and constraints are built...")
+
             # Call initialize_knowledge_system which internally calls build_indices_and_constraints
             # This ensures the setup is done properly and only once
             init_result = await self.ba_knowledge.initialize_knowledge_system()
-            
+            cls._init_result = init_result
+
             if init_result.get("status") == "success":
-                print("[DEBUG] Graph setup completed successfully")
+                logger.debug("Graph setup completed successfully")
+                _write_setup_checkpoint()
             else:
-                print(f"[DEBUG] Graph setup completed with status: {init_result.get('status')}")
-            
-            # Mark setup as completed regardless of status to prevent repeated attempts
-            ChatLifecycleHandler._graph_setup_completed = True
-            
+                logger.debug("Graph setup completed with status: %s", init_result.get("status"))
         except Exception as e:
-            print(f"[ERROR] Failed to setup graph indices and constraints: {e}")
-            # Still mark as completed to prevent repeated failed attempts
-            ChatLifecycleHandler._graph_setup_completed = True
-            await self.send_message(f"⚠️ Warning: Graph setup failed. Entity extraction may not work properly: {str(e)}")
+            logger.error("Failed to setup graph indices and constraints: %s", e)
+            startup_lines.append(f"⚠️ Warning: Graph setup failed. Entity extraction may not work properly: {str(e)}")
+        finally:
+            # Mark setup as completed regardless of status to prevent
+            # repeated attempts and release any waiting chat starts
+            cls._graph_setup_done.set()
     
-    async def _verify_system_configuration(self) -> None:
+    async def _verify_system_configuration(self, startup_lines: List[str]) -> None:
         """
         Verify that environment variables are loaded correctly and logging is configured.
         This helps debug system configuration issues.
         """
-        logger.info("[CONFIG] Verifying system configuration...")
-        
-        # Check critical environment variables
-        env_vars_to_check = [
-            "NEO4J_URI",
-            "NEO4J_USER", 
-            "NEO4J_PASSWORD",
-            "OPENAI_API_KEY",
-            "DEFAULT_DATABASE"
-        ]
-        
-        missing_vars = []
-        for var in env_vars_to_check:
-            value = os.getenv(var)
-            if not value:
-                missing_vars.append(var)
-                logger.error(f"[CONFIG] Missing environment variable: {var}")
-            else:
-                # Log partial value for security (don't log full API keys)
-                if "KEY" in var or "PASSWORD" in var:
-                    masked_value = value[:8] + "..." + value[-4:] if len(value) > 12 else "***"
-                    logger.info(f"[CONFIG] ✅ {var}: {masked_value}")
-                else:
-                    logger.info(f"[CONFIG] ✅ {var}: {value}")
-        
-        # Check optional environment variables
-        optional_vars = ["SEMAPHORE_LIMIT", "LLM_MODEL"]
-        for var in optional_vars:
-            value = os.getenv(var)
-            if value:
-                logger.info(f"[CONFIG] ✅ {var}: {value}")
-            else:
-                logger.info(f"[CONFIG] ⚠️ Optional {var}: not set (using defaults)")
-        
-        # Verify logging configuration
-        root_logger = logging.getLogger()
-        logger.info(f"[CONFIG] ✅ Logging level: {logging.getLevelName(root_logger.level)}")
-        logger.info(f"[CONFIG] ✅ Logging handlers: {len(root_logger.handlers)}")
-        
-        # Report configuration status
+        # The snapshot build and log emission hit synchronous I/O (stdout
+        # or file handlers), so they run off the event loop
+        _, _, report_msg = await asyncio.to_thread(self._scan_config_sync)
+
+        # Configuration status joins the batched startup report
+        startup_lines.append(report_msg)
+
+    @staticmethod
+    def _scan_config_sync():
+        """
+        Resolve the configuration snapshot and emit its log record.
+
+        Runs in a worker thread so logging handlers never block the event
+        loop.
+
+        Returns:
+            The (missing_vars, log_lines, report_msg) snapshot tuple
+        """
+        snapshot = _get_config_snapshot()
+        missing_vars, log_lines, report_msg = snapshot
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[CONFIG]\n%s", "\n".join(log_lines))
         if missing_vars:
-            error_msg = f"❌ Missing critical environment variables: {', '.join(missing_vars)}"
-            logger.error(f"[CONFIG] {error_msg}")
-            await self.send_message(f"⚠️ Configuration Error: {error_msg}")
-        else:
-            logger.info("[CONFIG] ✅ All critical environment variables loaded successfully")
-            await self.send_message("✅ System configuration verified successfully")
-        
-        # Test logging at different levels
-        logger.debug("[CONFIG] Debug logging test")
-        logger.info("[CONFIG] Info logging test")
-        logger.warning("[CONFIG] Warning logging test")
-        
-        logger.info("[CONFIG] System configuration verification completed")
+            logger.error("[CONFIG] %s", report_msg)
+        return snapshot
     
-    def get_available_commands(self) -> List[Dict[str, Any]]:
+    def get_available_commands(self) -> Tuple[Dict[str, Any], ...]:
         """
-        Get list of available commands for the chat interface.
-        
+        Get the available commands for the chat interface.
+
         Returns:
-            List of command dictionaries with id, icon, description, and button flag
+            Read-only tuple of command dictionaries with id, icon,
+            description, and button flag; callers needing a mutable list
+            should copy it themselves
         """
-        return self.commands.copy()
+        return self.commands
     
     async def set_custom_commands(self, commands: List[Dict[str, Any]]) -> None:
         """
@@ -211,5 +352,5 @@ class ChatLifecycleHandler(BaseChainlitHandler):
         Args:
             commands: List of command dictionaries to set
         """
-        self.commands = commands
-        await cl.context.emitter.set_commands(self.commands)
+        self.commands = tuple(commands)
+        await cl.context.emitter.set_commands(list(self.commands))
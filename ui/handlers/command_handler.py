@@ -4,11 +4,25 @@ Handles all command-based interactions and actions.
 Follows Single Responsibility Principle - only manages command processing.
 """
 
+import asyncio
 import chainlit as cl
 from .base_handler import BaseChainlitHandler
-from .response_formatter import ResponseFormatter
+from . import response_formatter
 from ..constants import Commands, UIMessages
 
+# Lazily resolved FileHandler class - the import stays out of module load
+# order (avoiding the circular import) but is paid only once per process
+_FileHandler = None
+
+
+def _get_file_handler_cls():
+    """Resolve the FileHandler class on first use and cache it."""
+    global _FileHandler
+    if _FileHandler is None:
+        from .file_handler import FileHandler
+        _FileHandler = FileHandler
+    return _FileHandler
+
 
 class CommandHandler(BaseChainlitHandler):
     """
@@ -25,6 +39,24 @@ class CommandHandler(BaseChainlitHandler):
     - Dependency Inversion: Uses BA Knowledge Service abstraction
     """
     
+    def __init__(self, factory):
+        """
+        Initialize command handler and its dispatch table.
+
+        Args:
+            factory: KnowledgeGraphFactory for dependency injection
+        """
+        super().__init__(factory)
+        # Dispatch table built once - O(1) lookup instead of walking an
+        # if/elif chain, and new commands only need a new entry here
+        self._command_handlers = {
+            Commands.ADD_FILE_SOURCE["id"]: self.handle_add_file_source,
+            Commands.MANAGER_FILE_SOURCE["id"]: self.handle_manager_file_source,
+            Commands.CLEAR_KNOWLEDGE_GRAPH["id"]: self.handle_clear_knowledge_graph
+        }
+        # FileHandler is constructed lazily and reused across commands
+        self._file_handler = None
+
     async def handle(self, command: str) -> None:
         """
         Main handler method for command processing.
@@ -42,14 +74,11 @@ class CommandHandler(BaseChainlitHandler):
         Args:
             command: Command string to process
         """
-        if command == Commands.ADD_FILE_SOURCE["id"]:
-            await self.handle_add_file_source()
-        elif command == Commands.MANAGER_FILE_SOURCE["id"]:
-            await self.handle_manager_file_source()
-        elif command == Commands.CLEAR_KNOWLEDGE_GRAPH["id"]:
-            await self.handle_clear_knowledge_graph()
+        handler = self._command_handlers.get(command)
+        if handler is not None:
+            await handler()
         else:
-            error_msg = UIMessages.UNKNOWN_COMMAND_ERROR.format(command=command)
+            error_msg = UIMessages.unknown_command(command)
             await self.send_error_message(error_msg)
     
     async def handle_add_file_source(self) -> None:
@@ -57,17 +86,16 @@ class CommandHandler(BaseChainlitHandler):
         Handle 'Add File Source' command.
         Delegates to FileHandler for file upload functionality.
         """
-        # Import FileHandler here to avoid circular imports
-        from .file_handler import FileHandler
-        file_handler = FileHandler(self.factory)
-        await file_handler.ask_file_source()
+        if self._file_handler is None:
+            self._file_handler = _get_file_handler_cls()(self.factory)
+        await self._file_handler.ask_file_source()
     
     async def handle_manager_file_source(self) -> None:
         """
         Handle 'Manager File Source' command.
         Currently shows coming soon message - ready for future implementation.
         """
-        message = ResponseFormatter.format_feature_coming_soon("File source management")
+        message = response_formatter.format_feature_coming_soon("File source management")
         await self.send_message(message)
     
     async def handle_clear_knowledge_graph(self) -> None:
@@ -82,14 +110,14 @@ class CommandHandler(BaseChainlitHandler):
         result = await self.ba_knowledge.clear_business_knowledge()
         
         if result.get("status") == "success":
-            success_message = ResponseFormatter.format_clear_success()
+            success_message = response_formatter.format_clear_success()
             await self.send_message(success_message)
             
             # Ask for new file source after clearing
             await self.handle_add_file_source()
         else:
             error_msg = result.get("message", "Unknown error occurred")
-            error_message = UIMessages.CLEAR_KNOWLEDGE_GRAPH_ERROR.format(message=error_msg)
+            error_message = UIMessages.clear_knowledge_graph_error(error_msg)
             await self.send_error_message(error_message)
     
     def get_supported_commands(self) -> list[str]:
@@ -100,21 +128,21 @@ class CommandHandler(BaseChainlitHandler):
         Returns:
             List of supported command strings
         """
-        return [
-            Commands.ADD_FILE_SOURCE["id"],
-            Commands.MANAGER_FILE_SOURCE["id"], 
-            Commands.CLEAR_KNOWLEDGE_GRAPH["id"]
-        ]
+        return list(self._command_handlers)
     
-    async def add_custom_command_handler(self, command: str, handler_func) -> None:
+    def add_custom_command_handler(self, command: str, handler_func) -> None:
         """
-        Add custom command handler for extensibility.
-        Future use for LangGraph agent integration or custom commands.
-        
+        Register a custom command handler in the dispatch table.
+        Lets agent integrations add commands at startup without touching
+        the built-in routing.
+
         Args:
             command: Command string to handle
             handler_func: Async function to handle the command
+
+        Raises:
+            TypeError: If handler_func is not a coroutine function
         """
-        # This method provides extensibility for future command additions
-        # Implementation would involve a command registry pattern
-        pass
+        if not asyncio.iscoroutinefunction(handler_func):
+            raise TypeError(f"Handler for command '{command}' must be a coroutine function")
+        self._command_handlers[command] = handler_func
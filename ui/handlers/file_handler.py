@@ -4,12 +4,30 @@ Handles file upload, processing, and knowledge graph integration.
 Follows Single Responsibility Principle - only manages file operations.
 """
 
+import asyncio
 import chainlit as cl
 from typing import List, Tuple, Any
 from .base_handler import BaseChainlitHandler
-from .response_formatter import ResponseFormatter
+from . import response_formatter
 from ..constants import FileTypes, FileSettings, UIMessages
 
+# Number of bytes read for magic-byte sniffing - enough for every
+# signature below without touching the rest of the upload
+_SNIFF_BYTES = 512
+
+# Grace period before announcing processing - cache hits finish inside
+# this window, so they go straight to the result message
+_ANNOUNCE_DELAY_SECONDS = 0.3
+
+# Magic-byte signatures mapped to the MIME types they can represent.
+# Zip and OLE containers are ambiguous between the Office formats, so
+# each signature carries the full candidate set.
+_MAGIC_SIGNATURES = (
+    (b"%PDF", frozenset({FileTypes.PDF})),
+    (b"PK\x03\x04", frozenset({FileTypes.DOCX, FileTypes.XLSX})),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", frozenset({FileTypes.DOC, FileTypes.XLS})),
+)
+
 
 class FileHandler(BaseChainlitHandler):
     """
@@ -35,7 +53,10 @@ class FileHandler(BaseChainlitHandler):
             factory: KnowledgeGraphFactory for dependency injection
         """
         super().__init__(factory)
-        self.supported_file_types = FileTypes.get_supported_types()
+        # Set-backed for O(1) membership checks, with a cached sorted
+        # view for read paths - mutation is rare, reads dominate
+        self._supported_file_types = set(FileTypes.SUPPORTED_MIME_TYPES)
+        self._supported_view: Tuple[str, ...] = tuple(sorted(self._supported_file_types))
     
     async def handle(self, files: List[Any]) -> None:
         """
@@ -55,7 +76,7 @@ class FileHandler(BaseChainlitHandler):
             max_size_mb=FileSettings.MAX_SIZE_MB,
             max_files=FileSettings.MAX_FILES,
             content=UIMessages.FILE_UPLOAD_REQUEST,
-            accept=self.supported_file_types
+            accept=list(self.get_supported_file_types())
         ).send()
         
         if files:
@@ -68,18 +89,27 @@ class FileHandler(BaseChainlitHandler):
         Args:
             files: List of uploaded files to process
         """
-        # Extract file names for user notification
-        file_names = [self._get_file_name(file) for file in files]
-        
-        # Notify user that processing has started
-        start_message = ResponseFormatter.format_file_processing_start(file_names)
-        await self.send_message(start_message)
-        
-        # Process files using BA knowledge service (Layer 3)
-        result = await self.ba_knowledge.process_uploaded_files(files)
-        
+        # Reject unsupported uploads before any conversion work is queued
+        valid_files, error_messages = await self.validate_files(files)
+        if error_messages:
+            await self.send_error_message("\n".join(error_messages))
+        if not valid_files:
+            return
+
+        # Process files in explicit batches so Layer 3 can amortize
+        # LLM/graph round-trips per batch
+        result_task = asyncio.create_task(self.process_files_in_batches(valid_files))
+
+        # Only announce if processing is actually going to take a moment -
+        # conversion-cache hits complete inside the grace period and would
+        # otherwise flash a stale "please wait" message
+        done, _ = await asyncio.wait({result_task}, timeout=_ANNOUNCE_DELAY_SECONDS)
+        if not done:
+            file_names = [self._get_file_name(file) for file in valid_files]
+            await self._announce_processing(file_names)
+
         # Send formatted results to user
-        await self._send_processing_result(result)
+        await self._send_processing_result(await result_task)
     
     async def add_files_to_episodes(self, files: List[Tuple[str, str]]) -> None:
         """
@@ -89,19 +119,32 @@ class FileHandler(BaseChainlitHandler):
         Args:
             files: List of tuples containing (file_path, file_content)
         """
-        # Extract file paths for user notification
+        # Extract file paths for user notification - the display step
+        # only needs the compact path strings, never the contents
         file_names = [file_path for file_path, _ in files]
-        
-        # Notify user that processing has started
-        start_message = ResponseFormatter.format_file_processing_start(file_names)
-        await self.send_message(start_message)
-        
+        await self._announce_processing(file_names)
+
         # Add files to knowledge graph using Layer 3
         result = await self.ba_knowledge.add_business_documents(files)
-        
+
+        # Drop our reference to the document contents before the result
+        # send awaits - lets GC reclaim the text buffers instead of
+        # pinning them for the rest of the UI round-trip
+        del files
+
         # Send formatted results to user
         await self._send_processing_result(result)
     
+    async def _announce_processing(self, file_names: List[str]) -> None:
+        """
+        Notify the user that file processing has started.
+
+        Args:
+            file_names: List of file names being processed
+        """
+        start_message = response_formatter.format_file_processing_start(file_names)
+        await self.send_message(start_message)
+
     async def _send_processing_result(self, result: dict) -> None:
         """
         Send formatted processing result to user.
@@ -110,88 +153,158 @@ class FileHandler(BaseChainlitHandler):
             result: Processing result dictionary from BA knowledge service
         """
         if result.get("status") == "success":
-            success_message = ResponseFormatter.format_processing_success(result)
+            success_message = response_formatter.format_processing_success(result)
             await self.send_message(success_message)
         else:
-            error_message = ResponseFormatter.format_processing_error(result)
+            error_message = response_formatter.format_processing_error(result)
             await self.send_message(error_message)
     
-    def _get_file_name(self, file: Any) -> str:
+    @staticmethod
+    def _get_file_name(file: Any) -> str:
         """
         Extract file name from file object.
-        
+
         Args:
             file: File object with name or path attribute
-            
+
         Returns:
             File name string
         """
-        if hasattr(file, 'name'):
-            return file.name
-        elif hasattr(file, 'path'):
-            return file.path
-        else:
-            return "Unknown file"
+        # Single getattr probe per attribute instead of hasattr + access
+        return getattr(file, 'name', None) or getattr(file, 'path', None) or "Unknown file"
     
-    def get_supported_file_types(self) -> List[str]:
+    def get_supported_file_types(self) -> Tuple[str, ...]:
         """
-        Get list of supported file MIME types.
-        
+        Get supported file MIME types.
+
         Returns:
-            List of supported MIME type strings
+            Sorted tuple of supported MIME type strings - the same cached
+            view on every call, so the hot read path allocates nothing.
+            Callers needing a mutable copy can list(...) it themselves.
         """
-        return self.supported_file_types.copy()
-    
+        return self._supported_view
+
     def add_supported_file_type(self, mime_type: str) -> None:
         """
         Add new supported file type.
         Useful for extending file support without modifying existing code.
-        
+
         Args:
             mime_type: MIME type string to add
         """
-        if mime_type not in self.supported_file_types:
-            self.supported_file_types.append(mime_type)
-    
+        self._supported_file_types.add(mime_type)
+        self._supported_view = tuple(sorted(self._supported_file_types))
+
     def remove_supported_file_type(self, mime_type: str) -> None:
         """
         Remove supported file type.
-        
+
         Args:
             mime_type: MIME type string to remove
         """
-        if mime_type in self.supported_file_types:
-            self.supported_file_types.remove(mime_type)
+        self._supported_file_types.discard(mime_type)
+        self._supported_view = tuple(sorted(self._supported_file_types))
     
     async def validate_files(self, files: List[Any]) -> Tuple[List[Any], List[str]]:
         """
-        Validate uploaded files against supported types and size limits.
-        Future method for enhanced file validation.
-        
+        Validate uploaded files by sniffing their magic bytes.
+
+        Only the first 512 bytes of each file are read, so validation
+        cost is independent of upload size and no subprocess (file(1))
+        is involved. Files whose signature maps outside the supported
+        MIME set are rejected before any conversion work.
+
         Args:
             files: List of files to validate
-            
+
         Returns:
             Tuple of (valid_files, error_messages)
         """
-        # Future implementation for file validation
-        # Would include checks for:
-        # - File type validation
-        # - File size limits
-        # - File content validation
-        # - Security checks
-        
-        return files, []
+        valid_files = []
+        error_messages = []
+        for file in files:
+            path = getattr(file, 'path', None)
+            if path is None:
+                # Nothing to sniff - let the converter decide
+                valid_files.append(file)
+                continue
+            try:
+                head = await asyncio.to_thread(self._read_head, path)
+            except OSError as e:
+                error_messages.append(f"{self._get_file_name(file)}: could not read file ({e})")
+                continue
+            if self._head_is_supported(head):
+                valid_files.append(file)
+            else:
+                error_messages.append(f"{self._get_file_name(file)}: unsupported file format")
+        return valid_files, error_messages
+
+    @staticmethod
+    def _read_head(path: str) -> bytes:
+        """Read the sniffing window from the start of a file."""
+        with open(path, "rb") as f:
+            return f.read(_SNIFF_BYTES)
+
+    def _head_is_supported(self, head: bytes) -> bool:
+        """
+        Check whether a file header matches a supported format.
+
+        Args:
+            head: Leading bytes of the file
+
+        Returns:
+            True if the signature maps to a supported MIME type, or the
+            content looks like plain text (markdown/html/txt)
+        """
+        for signature, candidate_mimes in _MAGIC_SIGNATURES:
+            if head.startswith(signature):
+                return not candidate_mimes.isdisjoint(self._supported_file_types)
+        # No container signature - accept as text unless it looks binary
+        return b"\x00" not in head
     
-    async def process_files_in_batches(self, files: List[Any], batch_size: int = 5) -> None:
+    async def process_files_in_batches(self, files: List[Any], batch_size: int = 5) -> dict:
         """
-        Process files in batches for better performance.
-        Future method for handling large file uploads.
-        
+        Process files in batches and aggregate the results.
+
+        Each batch is one Layer 3 call, so N files cost ceil(N/batch_size)
+        processing rounds instead of N while keeping the working set per
+        round bounded.
+
         Args:
             files: List of files to process
             batch_size: Number of files to process per batch
+
+        Returns:
+            Aggregated processing result dictionary
         """
-        # Future implementation for batch processing
-        # Useful for handling large numbers of files efficiently
-        pass
+        # Single-batch uploads skip the aggregation entirely
+        if len(files) <= batch_size:
+            return await self.ba_knowledge.process_uploaded_files(files)
+
+        summary_totals: dict = {}
+        by_category: dict = {}
+        errors = []
+        for start in range(0, len(files), batch_size):
+            batch = files[start:start + batch_size]
+            result = await self.ba_knowledge.process_uploaded_files(batch)
+            if result.get("status") != "success":
+                errors.append(result.get("message", "Unknown error"))
+            for key, value in (result.get("summary") or {}).items():
+                summary_totals[key] = summary_totals.get(key, 0) + value
+            for category, items in (result.get("by_category") or {}).items():
+                by_category.setdefault(category, []).extend(items)
+
+        if errors:
+            return {
+                "status": "error",
+                "message": "; ".join(errors),
+                "summary": summary_totals,
+                "by_category": by_category,
+                "error": f"{len(errors)} of {-(-len(files) // batch_size)} batches failed"
+            }
+        return {
+            "status": "success",
+            "message": f"Processed {len(files)} files in {-(-len(files) // batch_size)} batches",
+            "summary": summary_totals,
+            "by_category": by_category
+        }
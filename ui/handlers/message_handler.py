@@ -6,9 +6,12 @@ Follows Single Responsibility Principle - only manages message processing.
 
 import chainlit as cl
 from .base_handler import BaseChainlitHandler
-from .response_formatter import ResponseFormatter
 from ..constants import UIMessages
 
+# Upper bound on forwarded query length - keeps downstream tokenization
+# cost bounded for accidental pastes of whole documents
+_MAX_QUERY_CHARS = 4096
+
 
 class MessageHandler(BaseChainlitHandler):
     """
@@ -56,10 +59,19 @@ class MessageHandler(BaseChainlitHandler):
         Args:
             user_input: User input string to process
         """
+        # Empty submits would still pay a full retrieval round trip -
+        # answer them locally before touching Layer 3
+        query = user_input.strip() if user_input else ""
+        if not query:
+            await self.send_message(UIMessages.EMPTY_QUERY_PROMPT)
+            return
+        if len(query) > _MAX_QUERY_CHARS:
+            query = query[:_MAX_QUERY_CHARS]
+
         if self.use_agent and self.agent:
-            await self._handle_with_agent(user_input)
+            await self._handle_with_agent(query)
         else:
-            await self._handle_direct_search(user_input)
+            await self._handle_direct_search(query)
     
     async def _handle_direct_search(self, user_input: str) -> None:
         """
@@ -68,12 +80,15 @@ class MessageHandler(BaseChainlitHandler):
         Args:
             user_input: User input string to search
         """
-        # Use Layer 3 for business knowledge search with formatting
-        formatted_result = await self.ba_knowledge.search_business_knowledge(user_input)
-        
-        # Format and send the search result
-        response = ResponseFormatter.format_search_result(formatted_result)
-        await self.send_message(response)
+        # Stream results as Layer 3 formats them - the user sees the first
+        # match immediately instead of waiting for the whole block
+        msg = cl.Message(content=UIMessages.SEARCH_RESULT_PREFIX)
+        await msg.send()
+
+        async for fragment in self.ba_knowledge.astream_business_knowledge(user_input):
+            await msg.stream_token(fragment)
+
+        await msg.update()
     
     async def _handle_with_agent(self, user_input: str) -> None:
         """